@@ -5,4 +5,8 @@ export default {
   "specs": "Specs",
   "phase_retrieval_problem": "Phase Retrieval Problem",
   "visualization": "Visualization",
+  "axes_math": "Axes Math",
+  "detector": "Detector",
+  "transforms": "Transforms",
+  "units": "Units",
 };
@@ -4,17 +4,51 @@
  * Run: node lib/convert-notebooks.js
  */
 
+const crypto = require('crypto');
 const fs = require('fs');
 const path = require('path');
 
-const DOCS_DIR = path.join(__dirname, '..', 'app', 'docs');
+const ROOT_DIR = path.join(__dirname, '..');
+const DOCS_DIR = path.join(ROOT_DIR, 'app', 'docs');
 const OUTPUT_FOLDER_SUFFIX = '.notebook';
 const OUTPUT_FILE = 'page.mdx';
 
+// Output images are stored once under public/, named by content hash
+const IMAGES_DIR = path.join(ROOT_DIR, 'public', 'notebooks');
+const IMAGES_URL = '/notebooks';
+const IMAGE_EXTENSIONS = {
+  'image/png': 'png',
+  'image/jpeg': 'jpg',
+};
+
+// Hashes of converted notebooks, used to skip unchanged ones
+const CACHE_FILE = path.join(ROOT_DIR, '.temp', 'cache', 'notebooks.json');
+// Bump when the MDX output changes so that all notebooks are converted again
+const CONVERTER_VERSION = '2';
+
+/**
+ * Write image output to IMAGES_DIR (once per content) and return its URL
+ */
+function writeImage(base64, extension, images) {
+  const data = Buffer.from(base64.replace(/\n/g, ''), 'base64');
+  const hash = crypto.createHash('sha256').update(data).digest('hex').slice(0, 16);
+  const fileName = `${hash}.${extension}`;
+  const filePath = path.join(IMAGES_DIR, fileName);
+
+  if (!fs.existsSync(filePath)) {
+    fs.mkdirSync(IMAGES_DIR, { recursive: true });
+    fs.writeFileSync(filePath, data);
+  }
+
+  images.add(fileName);
+  return `${IMAGES_URL}/${fileName}`;
+}
+
 /**
- * Convert notebook JSON to MDX content
+ * Convert notebook JSON to MDX content.
+ * File names of written images are added to the `images` set.
  */
-function notebookToMdx(notebook) {
+function notebookToMdx(notebook, images) {
   const cells = notebook.cells || [];
   const metadata = notebook.metadata || {};
   const kernelSpec = metadata.kernelspec || {};
@@ -52,13 +86,14 @@ function notebookToMdx(notebook) {
         else if (output.output_type === 'execute_result' || output.output_type === 'display_data') {
           const data = output.data || {};
 
-          if (data['image/png']) {
-            const base64 = data['image/png'].replace(/\n/g, '');
-            mdx += `![Output](data:image/png;base64,${base64})\n\n`;
-          }
-          else if (data['image/jpeg']) {
-            const base64 = data['image/jpeg'].replace(/\n/g, '');
-            mdx += `![Output](data:image/jpeg;base64,${base64})\n\n`;
+          const imageType = Object.keys(IMAGE_EXTENSIONS).find(type => data[type]);
+
+          if (imageType) {
+            const base64 = Array.isArray(data[imageType])
+              ? data[imageType].join('')
+              : data[imageType];
+            const url = writeImage(base64, IMAGE_EXTENSIONS[imageType], images);
+            mdx += `![Output](${url})\n\n`;
           }
           else if (data['image/svg+xml']) {
             const svg = Array.isArray(data['image/svg+xml'])
@@ -125,6 +160,40 @@ function findNotebooks(dir) {
   return notebooks;
 }
 
+/**
+ * Load hashes of previously converted notebooks
+ */
+function loadCache() {
+  try {
+    const cache = JSON.parse(fs.readFileSync(CACHE_FILE, 'utf-8'));
+    if (cache.version === CONVERTER_VERSION) return cache.notebooks;
+  }
+  catch {
+    // No cache yet or it is corrupted - convert everything
+  }
+  return {};
+}
+
+function saveCache(notebooks) {
+  fs.mkdirSync(path.dirname(CACHE_FILE), { recursive: true });
+  fs.writeFileSync(CACHE_FILE, JSON.stringify({ version: CONVERTER_VERSION, notebooks }, null, 1), 'utf-8');
+}
+
+/**
+ * Remove images that are no longer referenced by any notebook
+ */
+function removeUnusedImages(cache) {
+  if (!fs.existsSync(IMAGES_DIR)) return;
+
+  const used = new Set(Object.values(cache).flatMap(entry => entry.images));
+  for (const fileName of fs.readdirSync(IMAGES_DIR)) {
+    if (!used.has(fileName)) {
+      fs.unlinkSync(path.join(IMAGES_DIR, fileName));
+      console.log(`🗑️  Removed unused image ${fileName}`);
+    }
+  }
+}
+
 /**
  * Main conversion function
  */
@@ -132,24 +201,40 @@ function convertAll() {
   console.log('🔍 Searching for notebooks in', DOCS_DIR);
 
   const notebooks = findNotebooks(DOCS_DIR);
+  const previous = loadCache();
+  const cache = {};
+  let skipped = 0;
 
   if (notebooks.length === 0) {
     console.log('📓 No notebooks found');
-    return;
   }
-
-  console.log(`📓 Found ${notebooks.length} notebook(s)`);
+  else {
+    console.log(`📓 Found ${notebooks.length} notebook(s)`);
+  }
 
   for (const notebookPath of notebooks) {
     // Create folder: example.ipynb -> example.notebook/page.mdx
     const baseName = path.basename(notebookPath, '.ipynb');
     const outputFolder = path.join(path.dirname(notebookPath), baseName + OUTPUT_FOLDER_SUFFIX);
     const outputPath = path.join(outputFolder, OUTPUT_FILE);
+    const cacheKey = path.relative(ROOT_DIR, notebookPath);
 
     try {
       const content = fs.readFileSync(notebookPath, 'utf-8');
+      const hash = crypto.createHash('sha256').update(content).digest('hex');
+
+      // Skip notebooks that have not changed since the last conversion
+      const entry = previous[cacheKey];
+      if (entry && entry.hash === hash && fs.existsSync(outputPath)
+          && entry.images.every(fileName => fs.existsSync(path.join(IMAGES_DIR, fileName)))) {
+        cache[cacheKey] = entry;
+        skipped++;
+        continue;
+      }
+
       const notebook = JSON.parse(content);
-      const mdx = notebookToMdx(notebook);
+      const images = new Set();
+      const mdx = notebookToMdx(notebook, images);
 
       // Create folder if not exists
       if (!fs.existsSync(outputFolder)) {
@@ -157,15 +242,22 @@ function convertAll() {
       }
 
       fs.writeFileSync(outputPath, mdx, 'utf-8');
+      cache[cacheKey] = { hash, images: [...images] };
 
       const relativePath = path.relative(process.cwd(), notebookPath);
       console.log(`✅ ${relativePath} → ${baseName + OUTPUT_FOLDER_SUFFIX}/page.mdx`);
     }
     catch (err) {
       console.error(`❌ Error converting ${notebookPath}:`, err.message);
+      // Keep the previous page and its images
+      if (previous[cacheKey]) cache[cacheKey] = previous[cacheKey];
     }
   }
 
+  removeUnusedImages(cache);
+  saveCache(cache);
+
+  if (skipped) console.log(`⏭️  ${skipped} unchanged notebook(s) skipped`);
   console.log('✨ Done!');
 }
 
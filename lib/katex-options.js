@@ -0,0 +1,16 @@
+/**
+ * KaTeX options shared by Nextra (next.config.ts) and lib/render-math.js,
+ * so pre-rendered formulas look the same as the ones Nextra renders
+ */
+module.exports = {
+  output: 'htmlAndMathml',
+  strict: 'ignore',
+  trust: true,
+  macros: {
+    '\\R': '\\mathbb{R}',
+    '\\C': '\\mathbb{C}',
+    '\\N': '\\mathbb{N}',
+    '\\Z': '\\mathbb{Z}',
+    '\\vec': '\\mathbf',
+  },
+};
@@ -0,0 +1,31 @@
+#!/usr/bin/env node
+/**
+ * Renders TeX formulas to HTML with KaTeX for scripts/generate-api.py
+ * (--prerender-math). Reads JSON lines {"tex", "display"} from stdin and
+ * answers each with a JSON line {"html"} or {"error"}, in the same order.
+ * Run by the generator as one long-lived process.
+ */
+
+const readline = require('readline');
+const katex = require('katex');
+const katexOptions = require('./katex-options');
+
+const input = readline.createInterface({ input: process.stdin, terminal: false });
+
+input.on('line', (line) => {
+  const { tex, display } = JSON.parse(line);
+  let result;
+  try {
+    // Macros are copied: KaTeX adds \gdef definitions to the object it gets
+    const html = katex.renderToString(tex, {
+      ...katexOptions,
+      macros: { ...katexOptions.macros },
+      displayMode: display,
+      throwOnError: true,
+    });
+    result = { html };
+  } catch (error) {
+    result = { error: String(error.message || error) };
+  }
+  process.stdout.write(JSON.stringify(result) + '\n');
+});
@@ -1,5 +1,6 @@
 import type { NextConfig } from "next";
 import nextra from "nextra";
+import katexOptions from "./lib/katex-options.js";
 
 const nextConfig: NextConfig = {
   output: "export",
@@ -16,18 +17,7 @@ const nextConfig: NextConfig = {
 const withNextra = nextra({
   latex: {
     renderer: "katex",
-    options: {
-      output: "htmlAndMathml",
-      strict: "ignore",
-      trust: true,
-      macros: {
-        "\\R": "\\mathbb{R}",
-        "\\C": "\\mathbb{C}",
-        "\\N": "\\mathbb{N}",
-        "\\Z": "\\mathbb{Z}",
-        "\\vec": "\\mathbf",
-      },
-    },
+    options: katexOptions,
   },
 });
 
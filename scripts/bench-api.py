@@ -0,0 +1,565 @@
+#!/usr/bin/env python3
+"""
+Бенчмарки генератора API документации.
+
+docstring — format_docstring на docstrings классов Wavefront и SimulationParameters.
+pipeline  — все стадии генератора на синтетическом пакете в стиле SVETlANNa.
+golden    — эталонный вывод генератора на зафиксированном дереве исходников
+            с порогами времени и памяти стадий.
+"""
+
+import argparse
+import contextlib
+import difflib
+import io
+import importlib.util
+import json
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+import types
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+GENERATOR_PATH = SCRIPT_DIR / "generate-api.py"
+
+# Классы, docstrings которых используются в бенчмарке docstring
+BENCH_SOURCES = {
+    "wavefront.py": "Wavefront",
+    "simulation_parameters.py": "SimulationParameters",
+}
+
+# Стадии бенчмарка pipeline в порядке выполнения
+STAGES = ["parse", "format_docstring", "render", "write", "write_noop"]
+
+# Эталон: исходники (source/), ожидаемый вывод (expected/<режим>/) и пороги (limits.json).
+# source/ — .py файлы SVETlANNa GOLDEN_SOURCE_VERSION (колесо с PyPI, лицензия MPL-2.0
+# в source/LICENSE); шаблоны и статика visualization генератору не нужны
+GOLDEN_DIR = SCRIPT_DIR / "fixtures" / "golden"
+GOLDEN_SOURCE_VERSION = "2.0.2"
+
+# Режимы эталона: имя каталога в expected/ -> дополнительные аргументы генератора
+GOLDEN_MODES = {
+    "default": [],
+    "split-pages": ["--split-pages"],
+}
+
+
+def load_generator(rev: str = None) -> types.ModuleType:
+    """Загружает generate-api.py из рабочей копии или из указанной git ревизии."""
+    if rev is None:
+        spec = importlib.util.spec_from_file_location("generate_api", GENERATOR_PATH)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    source = subprocess.run(
+        ["git", "-C", str(PROJECT_ROOT), "show", f"{rev}:scripts/generate-api.py"],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    module = types.ModuleType(f"generate_api_{rev}")
+    module.__file__ = str(GENERATOR_PATH)
+    exec(compile(source, f"{rev}:scripts/generate-api.py", "exec"), module.__dict__)
+    return module
+
+
+def clear_format_cache(generator: types.ModuleType) -> None:
+    """Очищает кэш format_docstring, чтобы каждый замер форматировал docstrings заново.
+
+    В старых ревизиях генератора кэша нет.
+    """
+    cache = getattr(generator, "FORMAT_CACHE", None)
+    if cache is not None:
+        cache.clear()
+
+
+# ---------------------------------------------------------------------------
+# docstring
+
+
+def collect_docstrings(generator: types.ModuleType, svetlanna_pkg: Path) -> dict[str, list[str]]:
+    """Собирает docstrings класса и всех его методов для каждого класса из BENCH_SOURCES."""
+    docstrings = {}
+    for filename, class_name in BENCH_SOURCES.items():
+        module_info = generator.parse_module(svetlanna_pkg / filename)
+        for cls in module_info["classes"]:
+            if cls["name"] == class_name:
+                docs = [cls["docstring"]] + [m["docstring"] for m in cls["methods"]]
+                docstrings[class_name] = [d for d in docs if d]
+    return docstrings
+
+
+def bench_docstrings(generator: types.ModuleType, docstrings: list[str], scale: int, number: int) -> float:
+    """Возвращает время одного вызова format_docstring на всём наборе (мкс)."""
+    # Увеличенный docstring: каждая секция повторена scale раз
+    samples = ["\n".join([d] * scale) for d in docstrings]
+
+    def run():
+        clear_format_cache(generator)
+        for docstring in samples:
+            generator.format_docstring(docstring)
+
+    best = min(timeit.repeat(run, number=number, repeat=5))
+    return best / number * 1e6
+
+
+def run_docstring(args: argparse.Namespace) -> None:
+    svetlanna_pkg = args.source / "svetlanna"
+    if not svetlanna_pkg.exists():
+        sys.exit(f"SVETlANNa sources not found in {args.source}, run generate-api.py first")
+
+    current = load_generator()
+    generators = [("current", current)]
+    if args.against:
+        generators.append((args.against, load_generator(args.against)))
+
+    docstrings = collect_docstrings(current, svetlanna_pkg)
+
+    header = f"{'class':<22}{'scale':>6}" + "".join(f"{name:>16}" for name, _ in generators)
+    print(header)
+    print("-" * len(header))
+    for class_name, docs in docstrings.items():
+        for scale in args.scale:
+            number = max(1, args.number // scale)
+            times = [bench_docstrings(generator, docs, scale, number) for _, generator in generators]
+            row = f"{class_name:<22}{scale:>6}" + "".join(f"{t:>13.1f} µs" for t in times)
+            if len(times) > 1:
+                row += f"   x{times[1] / times[0]:.2f}"
+            print(row)
+
+
+# ---------------------------------------------------------------------------
+# pipeline
+
+
+def synthetic_docstring(name: str, params: int, paragraphs: int) -> str:
+    """Numpy-style docstring с LaTeX, фигурными скобками и примерами."""
+    lines = [
+        f"{name} with transmission $\\hat{{T}}(x, y) = \\exp\\left(i \\frac{{2\\pi}}{{\\lambda}} z\\right)$.",
+        "",
+    ]
+    for p in range(paragraphs):
+        lines += [
+            f"Paragraph {p} describing the element in detail, the field {{E}} and the",
+            "$$",
+            f"E_{{{p}}}(x, y) = \\frac{{w_0}}{{w(z)}} \\exp\\left( -\\frac{{x^2 + y^2}}{{w(z)^2}} \\right)",
+            "$$",
+            "",
+        ]
+    lines += ["Parameters", "----------"]
+    for p in range(params):
+        lines += [
+            f"param_{p} : torch.Tensor | float, optional",
+            f"    Parameter number {p} of the element, $x_{{{p}}}$ in meters.",
+            "    Use `ureg` for units, by default `{'x': 1}`.",
+        ]
+    lines += [
+        "",
+        "Returns",
+        "-------",
+        "Wavefront",
+        "    Resulting wavefront.",
+        "",
+        "Raises",
+        "------",
+        "ValueError",
+        "    If the parameters are inconsistent.",
+        "",
+        "Examples",
+        "--------",
+        f">>> obj = {name.split('.')[0]}(param_0={{'x': 1}})",
+        ">>> obj(wavefront)",
+    ]
+    return "\n".join(lines)
+
+
+def synthetic_class(index: int, methods: int, params: int, paragraphs: int) -> str:
+    """Исходный код класса с конструктором, свойством, фабричным и обычными методами."""
+    name = f"Element{index}"
+    args = ", ".join(f"param_{p}: torch.Tensor | float = {p}.0" for p in range(params))
+    body = [
+        f"class {name}(Element):",
+        f'    r"""{synthetic_docstring(name, params, paragraphs)}"""',
+        "",
+        f"    def __init__(self, simulation_parameters: SimulationParameters, {args}) -> None:",
+        "        super().__init__(simulation_parameters)",
+        "",
+        "    @property",
+        "    def transmission_function(self) -> torch.Tensor:",
+        '        r"""The tensor representing transmission function of the element, $\\hat{T}$."""',
+        "",
+        "    @classmethod",
+        f"    def from_dict(cls, data: dict[str, float]) -> \"{name}\":",
+        f'        r"""{synthetic_docstring(name + ".from_dict", params, 1)}"""',
+        "",
+    ]
+    for m in range(methods):
+        body += [
+            f"    def method_{m}(self, incident_wavefront: Wavefront, {args}) -> Wavefront:",
+            f'        r"""{synthetic_docstring(f"{name}.method_{m}", params, paragraphs)}"""',
+            "",
+        ]
+    return "\n".join(body)
+
+
+def create_synthetic_package(root: Path, packages: int, modules: int, classes: int,
+                             methods: int, params: int, paragraphs: int) -> list[str]:
+    """Создаёт пакет svetlanna с packages подпакетами и возвращает их имена."""
+    package_names = []
+    for s in range(packages):
+        name = f"subpackage_{s}"
+        package_dir = root / "svetlanna" / name
+        package_dir.mkdir(parents=True)
+        (package_dir / "__init__.py").write_text(f'"""Synthetic subpackage {s}."""\n', encoding="utf-8")
+        for m in range(modules):
+            source = [
+                "import torch",
+                "from ..elements import Element",
+                "from ..simulation_parameters import SimulationParameters",
+                "from ..wavefront import Wavefront",
+                "",
+            ]
+            for c in range(classes):
+                # Сквозная нумерация, чтобы классы не дедуплицировались
+                index = m * classes + c
+                source += [synthetic_class(index, methods, params, paragraphs), ""]
+            source += [
+                f"def helper_{m}(x: torch.Tensor, *, alpha: float = 1.0) -> torch.Tensor:",
+                f'    r"""{synthetic_docstring(f"helper_{m}", params, paragraphs)}"""',
+                "",
+            ]
+            (package_dir / f"module_{m}.py").write_text("\n".join(source), encoding="utf-8")
+        package_names.append(name)
+    return package_names
+
+
+def timed(func, repeat: int) -> tuple[float, object]:
+    """Лучшее время из repeat запусков и результат последнего."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run_pipeline_stages(generator: types.ModuleType, root: Path, package_names: list[str],
+                        repeat: int) -> tuple[dict, dict]:
+    """Замеряет стадии генератора и возвращает (время стадий, счётчики)."""
+    svetlanna_pkg = root / "svetlanna"
+    file_groups = generator.package_file_groups(svetlanna_pkg, generator.walk_package(svetlanna_pkg))
+    file_groups = [file_groups[name] for name in package_names]
+    all_files = [path for group in file_groups for path in group]
+    stages = {}
+
+    stages["parse"], parsed = timed(lambda: [generator.parse_module(path) for path in all_files], repeat)
+
+    resolver = generator.ExportResolver(svetlanna_pkg, dict(zip(all_files, parsed)))
+    modules = [generator.ApiModule.from_info(name, generator.collect_submodule_info(resolver, files))
+               for name, files in zip(package_names, file_groups)]
+
+    docstrings = [d for module in modules for d in generator.module_docstrings(module)]
+
+    def format_all():
+        clear_format_cache(generator)
+        return [generator.format_docstring(d) for d in docstrings]
+
+    stages["format_docstring"], _ = timed(format_all, repeat)
+
+    pages = [page for module in modules for page in generator.module_pages(module)[0]]
+
+    def render_all():
+        clear_format_cache(generator)
+        return ["\n".join(render()) for _, render in pages]
+
+    stages["render"], rendered = timed(render_all, repeat)
+
+    def write(output_dir: Path):
+        clear_format_cache(generator)
+        writer = generator.OutputWriter(output_dir, output_dir.parent / "manifest.json")
+        # Вывод "Generated: ..." не нужен в отчёте
+        with contextlib.redirect_stdout(io.StringIO()):
+            writer.emit_many(pages)
+            writer.finalize()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        write_times = []
+        for attempt in range(repeat):
+            output_dir = tmp_path / f"out{attempt}" / "api"
+            start = time.perf_counter()
+            write(output_dir)
+            write_times.append(time.perf_counter() - start)
+        stages["write"] = min(write_times)
+        stages["write_noop"], _ = timed(lambda: write(tmp_path / "out0" / "api"), repeat)
+
+    counts = {
+        "files": len(all_files),
+        "classes": sum(len(module.classes) for module in modules),
+        "methods": sum(len(c.methods) for module in modules for c in module.classes),
+        "docstrings": len(docstrings),
+        "docstring_bytes": sum(len(d.encode("utf-8")) for d in docstrings),
+        "output_bytes": sum(len(page.encode("utf-8")) for page in rendered),
+    }
+    return stages, counts
+
+
+def compare_results(current: dict, baseline: dict, threshold: float) -> bool:
+    """Печатает сравнение с базовыми результатами; True, если есть регрессии."""
+    if current["config"] != baseline["config"]:
+        print("warning: benchmark configurations differ, comparison may be meaningless")
+
+    regressions = False
+    print(f"\n{'stage':<18}{'baseline':>12}{'current':>12}{'ratio':>9}")
+    for stage in STAGES:
+        if stage not in baseline["stages"]:
+            continue
+        old, new = baseline["stages"][stage], current["stages"][stage]
+        ratio = new / old if old else float("inf")
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  REGRESSION"
+            regressions = True
+        elif ratio < 1 - threshold:
+            flag = "  faster"
+        print(f"{stage:<18}{old * 1e3:>10.1f}ms{new * 1e3:>10.1f}ms{ratio:>8.2f}x{flag}")
+    return regressions
+
+
+def run_pipeline(args: argparse.Namespace) -> None:
+    generator = load_generator()
+    config = {
+        "packages": args.packages,
+        "modules": args.modules,
+        "classes": args.classes,
+        "methods": args.methods,
+        "params": args.params,
+        "paragraphs": args.paragraphs,
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        package_names = create_synthetic_package(root, **config)
+        stages, counts = run_pipeline_stages(generator, root, package_names, args.repeat)
+
+    result = {
+        "config": config,
+        "python": platform.python_version(),
+        "stages": stages,
+        "counts": counts,
+    }
+
+    print(f"{counts['files']} files, {counts['classes']} classes, {counts['methods']} methods, "
+          f"{counts['docstring_bytes'] / 1024:.0f} KiB docstrings -> {counts['output_bytes'] / 1024:.0f} KiB MDX")
+    for stage in STAGES:
+        print(f"{stage:<18}{stages[stage] * 1e3:>10.1f}ms")
+
+    if args.output:
+        args.output.write_text(json.dumps(result, indent=2) + "\n", encoding="utf-8")
+        print(f"\nResults saved to {args.output}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        if compare_results(result, baseline, args.threshold):
+            sys.exit(1)
+
+
+# ---------------------------------------------------------------------------
+# golden
+
+
+def run_golden_generator(root: Path, options: list[str], memory: bool) -> dict:
+    """Запускает генератор на эталонных исходниках с выводом в root.
+
+    Генератор загружается заново, чтобы кэши уровня модуля (FORMAT_CACHE)
+    не переходили между запусками. Возвращает время стадий (--timings-json).
+    """
+    generator = load_generator()
+    timings_path = root / "timings.json"
+    argv = ["--source", str(GOLDEN_DIR / "source"), "--project-root", str(root),
+            "--timings-json", str(timings_path), *options]
+    output = io.StringIO()
+    if memory:
+        tracemalloc.start()
+    try:
+        with contextlib.redirect_stdout(output):
+            generator.main(argv)
+    except SystemExit as error:
+        print(output.getvalue())
+        sys.exit(f"generate-api.py {' '.join(options)} failed: {error}")
+    finally:
+        if memory:
+            tracemalloc.stop()
+    return json.loads(timings_path.read_text(encoding="utf-8"))
+
+
+def golden_files(api_dir: Path, symbols_path: Path) -> dict[str, bytes]:
+    """Страницы API и индекс символов: {путь в эталоне: содержимое}."""
+    files = {}
+    for path in sorted(api_dir.rglob("*")):
+        if path.is_file():
+            files[f"api/{path.relative_to(api_dir).as_posix()}"] = path.read_bytes()
+    if symbols_path.exists():
+        files["api-symbols.json"] = symbols_path.read_bytes()
+    return files
+
+
+def output_files(root: Path) -> dict[str, bytes]:
+    """Вывод генератора в каталоге проекта root в раскладке эталона."""
+    return golden_files(root / "app" / "docs" / "api", root / "public" / "api-symbols.json")
+
+
+def copy_output(root: Path, target: Path) -> None:
+    """Копирует вывод генератора из каталога проекта root в каталог эталона target."""
+    if target.exists():
+        shutil.rmtree(target)
+    shutil.copytree(root / "app" / "docs" / "api", target / "api")
+    shutil.copyfile(root / "public" / "api-symbols.json", target / "api-symbols.json")
+
+
+def compare_golden(expected: dict[str, bytes], actual: dict[str, bytes], max_lines: int = 40) -> list[str]:
+    """Сравнивает вывод с эталоном побайтово; возвращает отличающиеся файлы и печатает diff."""
+    changed = []
+    for name in sorted(expected.keys() | actual.keys()):
+        old, new = expected.get(name), actual.get(name)
+        if old == new:
+            continue
+        changed.append(name)
+        if old is None or new is None:
+            print(f"{'A' if old is None else 'D'} {name}")
+            continue
+        print(f"M {name}")
+        diff = difflib.unified_diff(
+            old.decode("utf-8", "replace").splitlines(), new.decode("utf-8", "replace").splitlines(),
+            f"expected/{name}", f"actual/{name}", lineterm="",
+        )
+        for index, line in enumerate(diff):
+            if index == max_lines:
+                print("  ...")
+                break
+            print(f"  {line}")
+    return changed
+
+
+def check_limits(mode: str, stages: dict[str, float], memory: dict[str, int], limits: dict,
+                 slack: float) -> bool:
+    """Печатает время и пик памяти стадий рядом с порогами; True, если порог превышен.
+
+    slack умножает только пороги времени: пик памяти от машины не зависит.
+    """
+    exceeded = False
+    print(f"\n{mode}")
+    print(f"{'stage':<18}{'time':>10}{'limit':>10}{'peak':>12}{'limit':>12}")
+    for stage, seconds in stages.items():
+        time_limit = limits["time_ms"].get(stage)
+        memory_limit = limits["memory_kib"].get(stage)
+        row = f"{stage:<18}{seconds * 1e3:>8.1f}ms"
+        row += f"{time_limit * slack:>8.0f}ms" if time_limit is not None else f"{'-':>10}"
+        peak = memory.get(stage)
+        row += f"{peak / 1024:>8.0f} KiB" if peak is not None else f"{'-':>12}"
+        row += f"{memory_limit:>8.0f} KiB" if memory_limit is not None else f"{'-':>12}"
+        flags = []
+        if time_limit is not None and seconds * 1e3 > time_limit * slack:
+            flags.append("SLOW")
+        if memory_limit is not None and peak is not None and peak / 1024 > memory_limit:
+            flags.append("MEMORY")
+        if flags:
+            exceeded = True
+            row += "  " + " ".join(flags)
+        print(row)
+    return exceeded
+
+
+def run_golden(args: argparse.Namespace) -> None:
+    limits = json.loads((GOLDEN_DIR / "limits.json").read_text(encoding="utf-8"))
+    failed = False
+    for mode, options in GOLDEN_MODES.items():
+        expected_dir = GOLDEN_DIR / "expected" / mode
+        with tempfile.TemporaryDirectory() as tmp:
+            # Время — лучшее из нескольких холодных запусков без tracemalloc,
+            # память — в отдельном запуске: трассировка замедляет стадии
+            stages = {}
+            for attempt in range(args.repeat):
+                root = Path(tmp) / f"time{attempt}"
+                for stage, seconds in run_golden_generator(root, options, memory=False)["stages"].items():
+                    stages[stage] = min(seconds, stages.get(stage, seconds))
+            memory_root = Path(tmp) / "memory"
+            memory = run_golden_generator(memory_root, options, memory=True).get("memory", {})
+
+            output_root = Path(tmp) / "time0"
+            if args.update:
+                copy_output(output_root, expected_dir)
+                print(f"Updated {expected_dir.relative_to(PROJECT_ROOT)}")
+            else:
+                actual = output_files(output_root)
+                expected = golden_files(expected_dir / "api", expected_dir / "api-symbols.json")
+                changed = compare_golden(expected, actual)
+                if changed:
+                    print(f"{mode}: {len(changed)} files differ from {expected_dir.relative_to(PROJECT_ROOT)}")
+                    failed = True
+                # Вывод не должен зависеть от трассировки и повторов
+                if output_files(memory_root) != actual:
+                    print(f"{mode}: output differs between runs")
+                    failed = True
+
+        mode_limits = {**limits[mode], "time_ms": {}} if args.no_time_limits else limits[mode]
+        if check_limits(mode, stages, memory, mode_limits, args.slack):
+            failed = True
+
+    if failed:
+        sys.exit(1)
+    checked = "memory" if args.no_time_limits else "time and memory"
+    print(f"\nGolden output for SVETlANNa {GOLDEN_SOURCE_VERSION} matches, {checked} of all stages within limits")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарки генератора API документации")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    docstring = subparsers.add_parser("docstring", help="format_docstring на реальных docstrings")
+    docstring.add_argument("--source", type=Path, default=PROJECT_ROOT / ".temp" / "SVETlANNa",
+                           help="путь к клону SVETlANNa")
+    docstring.add_argument("--against", metavar="REV",
+                           help="git ревизия генератора для сравнения")
+    docstring.add_argument("--scale", type=int, nargs="+", default=[1, 10, 100],
+                           help="во сколько раз увеличить docstrings")
+    docstring.add_argument("--number", type=int, default=20)
+    docstring.set_defaults(func=run_docstring)
+
+    pipeline = subparsers.add_parser("pipeline", help="все стадии на синтетическом пакете")
+    pipeline.add_argument("--packages", type=int, default=5, help="число подпакетов")
+    pipeline.add_argument("--modules", type=int, default=4, help="модулей в подпакете")
+    pipeline.add_argument("--classes", type=int, default=5, help="классов в модуле")
+    pipeline.add_argument("--methods", type=int, default=6, help="методов в классе")
+    pipeline.add_argument("--params", type=int, default=6, help="параметров в каждом docstring")
+    pipeline.add_argument("--paragraphs", type=int, default=2, help="абзацев с формулами в docstring")
+    pipeline.add_argument("--repeat", type=int, default=3, help="повторов каждой стадии")
+    pipeline.add_argument("--output", type=Path, help="сохранить результаты в JSON")
+    pipeline.add_argument("--compare", type=Path, help="сравнить с сохранёнными результатами")
+    pipeline.add_argument("--threshold", type=float, default=0.15,
+                          help="допустимое замедление стадии (доля), по умолчанию 0.15")
+    pipeline.set_defaults(func=run_pipeline)
+
+    golden = subparsers.add_parser("golden", help="эталонный вывод и пороги времени и памяти стадий")
+    golden.add_argument("--repeat", type=int, default=3, help="запусков для измерения времени")
+    golden.add_argument("--slack", type=float, default=1.0,
+                        help="множитель порогов времени для медленных машин (CI), по умолчанию 1.0")
+    golden.add_argument("--no-time-limits", action="store_true",
+                        help="не проверять пороги времени (вывод и память проверяются)")
+    golden.add_argument("--update", action="store_true",
+                        help="перезаписать ожидаемый вывод (пороги в limits.json правятся вручную)")
+    golden.set_defaults(func=run_golden)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Предварительное сжатие статического сайта для nginx (gzip_static).
+
+Рядом с каждым текстовым файлом out/ записывается .gz (и .br, если
+установлен модуль brotli) с максимальным сжатием. Сжатые данные
+хранятся в кэше по sha256 содержимого, поэтому файлы, не изменившиеся
+с прошлой сборки, повторно не сжимаются.
+"""
+
+import argparse
+import gzip
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+SCRIPT_DIR = Path(__file__).parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+
+# Расширения файлов, которые имеет смысл сжимать. Индекс pagefind (.pf_*)
+# pagefind уже сжимает сам.
+COMPRESSIBLE = {".html", ".js", ".mjs", ".css", ".json", ".txt", ".xml", ".svg", ".map", ".webmanifest"}
+
+# Файлы меньше этого размера не сжимаются (как gzip_min_length в nginx.conf)
+MIN_SIZE = 1024
+
+
+def walk_static(root: Path) -> list[Path]:
+    """Файлы out/ для сжатия; каждый каталог читается один раз через os.scandir."""
+    files = []
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(Path(entry.path))
+                elif (os.path.splitext(entry.name)[1] in COMPRESSIBLE
+                      and entry.is_file(follow_symlinks=False)
+                      and entry.stat().st_size >= MIN_SIZE):
+                    files.append(Path(entry.path))
+    return files
+
+
+def compress_file(path: Path, cache_dir: Path) -> tuple[int, dict[str, int], bool, str]:
+    """Записывает сжатые копии path, беря их из кэша, если содержимое не менялось.
+
+    Возвращает (размер, {расширение: размер сжатой копии}, взято ли из кэша, ключ кэша).
+    """
+    data = path.read_bytes()
+    key = hashlib.sha256(data).hexdigest()
+    encoders = {".gz": lambda: gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        encoders[".br"] = lambda: brotli.compress(data, quality=11)
+
+    reused = True
+    sizes = {}
+    stat = path.stat()
+    for suffix, encode in encoders.items():
+        cached = cache_dir / f"{key}{suffix}"
+        if not cached.exists():
+            reused = False
+            # Одинаковые файлы дают один ключ и могут сжиматься в соседних потоках,
+            # поэтому у каждого потока своё имя временного файла
+            with tempfile.NamedTemporaryFile(dir=cache_dir, prefix=cached.name + ".",
+                                             suffix=".tmp", delete=False) as tmp:
+                tmp.write(encode())
+            os.replace(tmp.name, cached)
+        target = path.with_name(path.name + suffix)
+        shutil.copyfile(cached, target)
+        # nginx отдаёт Last-Modified сжатой копии — он должен совпадать с исходным файлом
+        os.utime(target, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        sizes[suffix] = cached.stat().st_size
+    return len(data), sizes, reused, key
+
+
+def remove_stale(root: Path, files: list[Path]) -> int:
+    """Удаляет сжатые копии файлов, которых больше нет или которые больше не сжимаются."""
+    sources = {str(path) for path in files}
+    removed = 0
+    for path in root.rglob("*"):
+        if path.suffix in (".gz", ".br") and path.with_suffix("").suffix in COMPRESSIBLE:
+            if str(path.with_suffix("")) not in sources:
+                path.unlink()
+                removed += 1
+    return removed
+
+
+def prune_cache(cache_dir: Path, keys: set[str]) -> None:
+    """Оставляет в кэше только копии файлов текущей сборки."""
+    for path in cache_dir.iterdir():
+        if path.name.split(".", 1)[0] not in keys:
+            path.unlink()
+
+
+def main(argv: Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(description="Предварительное сжатие статического сайта для nginx")
+    parser.add_argument("root", type=Path, nargs="?", default=PROJECT_ROOT / "out",
+                        help="каталог собранного сайта (по умолчанию out/)")
+    parser.add_argument("--cache", type=Path, default=PROJECT_ROOT / ".temp" / "cache" / "static",
+                        help="каталог кэша сжатых файлов")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="число потоков (zlib и brotli отпускают GIL)")
+    args = parser.parse_args(argv)
+
+    if not args.root.is_dir():
+        sys.exit(f"{args.root} is not a directory")
+    if brotli is None:
+        print("brotli is not installed, writing .gz only")
+
+    start = time.perf_counter()
+    args.cache.mkdir(parents=True, exist_ok=True)
+    files = walk_static(args.root)
+    with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+        results = list(executor.map(compress_file, files, [args.cache] * len(files)))
+    removed = remove_stale(args.root, files)
+    prune_cache(args.cache, {key for *_, key in results})
+
+    total = sum(size for size, *_ in results)
+    reused = sum(1 for _, _, was_reused, _ in results if was_reused)
+    line = f"Compressed {len(files)} files ({reused} from cache, {removed} stale removed): {total / 1024:.1f} KiB"
+    for suffix in (".gz", ".br"):
+        compressed = sum(sizes[suffix] for _, sizes, *_ in results if suffix in sizes)
+        if compressed:
+            line += f", {suffix} {compressed / 1024:.1f} KiB"
+    print(f"{line} in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,12 @@
+export default {
+  "core": "Core",
+  "elements": "Elements",
+  "networks": "Networks",
+  "specs": "Specs",
+  "phase_retrieval_problem": "Phase Retrieval Problem",
+  "visualization": "Visualization",
+  "axes_math": "Axes Math",
+  "detector": "Detector",
+  "transforms": "Transforms",
+  "units": "Units",
+};
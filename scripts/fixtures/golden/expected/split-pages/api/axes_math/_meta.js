@@ -0,0 +1,3 @@
+export default {
+  "functions": "Функции",
+};
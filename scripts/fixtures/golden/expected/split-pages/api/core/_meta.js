@@ -0,0 +1,9 @@
+export default {
+  "parameter": "Parameter",
+  "constrainedparameter": "ConstrainedParameter",
+  "partialwithparameters": "PartialWithParameters",
+  "linearopticalsetup": "LinearOpticalSetup",
+  "simulationparameters": "SimulationParameters",
+  "wavefront": "Wavefront",
+  "functions": "Функции",
+};
@@ -0,0 +1,4 @@
+export default {
+  "detector": "Detector",
+  "detectorprocessorclf": "DetectorProcessorClf",
+};
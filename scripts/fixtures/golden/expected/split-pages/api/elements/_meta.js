@@ -0,0 +1,11 @@
+export default {
+  "element": "Element",
+  "freespace": "FreeSpace",
+  "aperture": "Aperture",
+  "roundaperture": "RoundAperture",
+  "rectangularaperture": "RectangularAperture",
+  "thinlens": "ThinLens",
+  "spatiallightmodulator": "SpatialLightModulator",
+  "diffractivelayer": "DiffractiveLayer",
+  "nonlinearelement": "NonlinearElement",
+};
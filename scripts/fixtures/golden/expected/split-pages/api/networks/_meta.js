@@ -0,0 +1,8 @@
+export default {
+  "linearopticalsetuplike": "LinearOpticalSetupLike",
+  "simplereservoir": "SimpleReservoir",
+  "linearautoencoder": "LinearAutoencoder",
+  "convlayer4f": "ConvLayer4F",
+  "convdiffnetwork4f": "ConvDiffNetwork4F",
+  "diffractivernn": "DiffractiveRNN",
+};
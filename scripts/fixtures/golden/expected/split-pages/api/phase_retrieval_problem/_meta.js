@@ -0,0 +1,5 @@
+export default {
+  "phaseretrievalresult": "PhaseRetrievalResult",
+  "setuplike": "SetupLike",
+  "functions": "Функции",
+};
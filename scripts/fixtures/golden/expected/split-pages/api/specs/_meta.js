@@ -0,0 +1,14 @@
+export default {
+  "representation": "Representation",
+  "strrepresentation": "StrRepresentation",
+  "markdownrepresentation": "MarkdownRepresentation",
+  "htmlrepresentation": "HTMLRepresentation",
+  "reprrepr": "ReprRepr",
+  "imagerepr": "ImageRepr",
+  "npyfilerepr": "NpyFileRepr",
+  "prettyreprrepr": "PrettyReprRepr",
+  "parameterspecs": "ParameterSpecs",
+  "parametersavecontext": "ParameterSaveContext",
+  "specsable": "Specsable",
+  "subelementspecs": "SubelementSpecs",
+};
@@ -0,0 +1,4 @@
+export default {
+  "towavefront": "ToWavefront",
+  "gaussmodulation": "GaussModulation",
+};
@@ -0,0 +1,3 @@
+export default {
+  "ureg": "ureg",
+};
@@ -0,0 +1,4 @@
+export default {
+  "elementhtml": "ElementHTML",
+  "functions": "Функции",
+};
@@ -0,0 +1,24 @@
+from .parameters import Parameter, ConstrainedParameter
+from .partial_with_parameters import PartialWithParameters
+from .setup import LinearOpticalSetup
+from .simulation_parameters import SimulationParameters
+from .wavefront import Wavefront
+from .debug_logging import set_debug_logging
+from . import elements
+from . import units
+from . import specs
+from . import networks
+
+__all__ = [
+    "Parameter",
+    "ConstrainedParameter",
+    "PartialWithParameters",
+    "LinearOpticalSetup",
+    "SimulationParameters",
+    "Wavefront",
+    "set_debug_logging",
+    "elements",
+    "units",
+    "specs",
+    "networks",
+]
@@ -0,0 +1,19 @@
+from .element import Element
+from .free_space import FreeSpace
+from .aperture import Aperture, RoundAperture, RectangularAperture
+from .lens import ThinLens
+from .slm import SpatialLightModulator
+from .diffractive_layer import DiffractiveLayer
+from .nonlinear_element import NonlinearElement
+
+__all__ = [
+    "Element",
+    "FreeSpace",
+    "Aperture",
+    "RoundAperture",
+    "RectangularAperture",
+    "ThinLens",
+    "SpatialLightModulator",
+    "DiffractiveLayer",
+    "NonlinearElement",
+]
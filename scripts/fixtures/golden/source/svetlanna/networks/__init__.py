@@ -0,0 +1,14 @@
+from .base import LinearOpticalSetupLike
+from .reservoir import SimpleReservoir
+from .autoencoder import LinearAutoencoder
+from .diffractive_conv import ConvLayer4F, ConvDiffNetwork4F
+from .diffractive_rnn import DiffractiveRNN
+
+__all__ = [
+    "LinearOpticalSetupLike",
+    "SimpleReservoir",
+    "LinearAutoencoder",
+    "ConvLayer4F",
+    "ConvDiffNetwork4F",
+    "DiffractiveRNN",
+]
@@ -0,0 +1,14 @@
+from .phase_retrieval import retrieve_phase
+from .phase_retrieval import SetupLike
+from .algorithms import gerchberg_saxton_algorithm
+from .algorithms import hybrid_input_output
+from .phase_retrieval_result import PhaseRetrievalResult
+
+
+__all__ = [
+    "retrieve_phase",
+    "gerchberg_saxton_algorithm",
+    "hybrid_input_output",
+    "PhaseRetrievalResult",
+    "SetupLike",
+]
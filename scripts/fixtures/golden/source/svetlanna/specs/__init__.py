@@ -0,0 +1,21 @@
+from .specs import Representation, StrRepresentation, MarkdownRepresentation
+from .specs import HTMLRepresentation
+from .specs import ReprRepr, ImageRepr, NpyFileRepr, PrettyReprRepr
+from .specs import ParameterSpecs, ParameterSaveContext
+from .specs import Specsable, SubelementSpecs
+
+
+__all__ = [
+    "Representation",
+    "StrRepresentation",
+    "MarkdownRepresentation",
+    "HTMLRepresentation",
+    "ReprRepr",
+    "ImageRepr",
+    "NpyFileRepr",
+    "PrettyReprRepr",
+    "ParameterSpecs",
+    "ParameterSaveContext",
+    "Specsable",
+    "SubelementSpecs",
+]
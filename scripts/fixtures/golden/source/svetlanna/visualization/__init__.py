@@ -0,0 +1,10 @@
+from .widgets import show_specs, show_structure, show_stepwise_forward
+from .widgets import jinja_env, ElementHTML
+
+__all__ = [
+    "show_specs",
+    "show_structure",
+    "show_stepwise_forward",
+    "jinja_env",
+    "ElementHTML",
+]
@@ -4,23 +4,226 @@
 Парсит docstrings из исходного кода и генерирует MDX файлы.
 """
 
+import argparse
 import ast
+import copy
+import cProfile
+import difflib
+import fnmatch
+import gzip
+import hashlib
+import json
 import os
-import shutil
+import re
 import subprocess
 import sys
-from pathlib import Path
-from typing import Optional
+import time
+import tracemalloc
+import traceback
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path, PurePosixPath
+from typing import Callable, Iterable, Iterator, Optional
+
+
+REPO_URL = "https://github.com/CompPhysLab/SVETlANNa.git"
+
+# Версия генератора: входит в ключ кэша, при изменении формата
+# parse_module все закэшированные результаты становятся недействительными
+GENERATOR_VERSION = "3"
+
+# ast.unparse зависит от версии Python, поэтому она тоже входит в ключ
+CACHE_SALT = f"{GENERATOR_VERSION}-py{sys.version_info.major}.{sys.version_info.minor}"
+
+# Суммарное время format_docstring в текущем процессе (для --timings)
+FORMAT_STATS = {"calls": 0, "hits": 0, "seconds": 0.0}
+
+# Отформатированные docstrings по содержимому и таблице символов: копии
+# docstrings у наследников и повторный рендер страницы при записи не
+# форматируются заново. При переполнении кэш очищается целиком.
+FORMAT_CACHE: dict[tuple[Optional[str], str], str] = {}
+FORMAT_CACHE_SIZE = 4096
+
+# Коды выхода --check: страницы устарели / проверка не выполнена (сеть, ошибка)
+CHECK_OUTDATED = 1
+CHECK_ERROR = 2
+
+
+def resolve_remote_ref(repo_url: str, ref: str = "HEAD") -> str:
+    """Возвращает хэш коммита, на который указывает ref в удалённом репозитории.
+
+    git ls-remote сравнивает шаблон с концом имени ("v1" находит и
+    "refs/heads/a/v1"), поэтому берутся только точные совпадения: тег,
+    затем ветка, затем полное имя ref. Имя, которое есть и среди тегов,
+    и среди веток, считается неоднозначным.
+    """
+    result = subprocess.run(
+        ["git", "ls-remote", repo_url, ref, f"{ref}^{{}}"],
+        check=True, capture_output=True, text=True,
+    )
+    refs = {}
+    for line in result.stdout.splitlines():
+        commit, name = line.split("\t", 1)
+        refs[name] = commit
+
+    candidates = [name for name in (f"refs/tags/{ref}", f"refs/heads/{ref}") if name in refs]
+    if len(candidates) > 1:
+        raise RuntimeError(f"Ref {ref!r} is ambiguous in {repo_url}: {', '.join(candidates)}")
+    if not candidates and ref in refs:
+        candidates = [ref]
+    if not candidates:
+        raise RuntimeError(f"Ref {ref!r} not found in {repo_url}")
+    # Для аннотированного тега нужен коммит ("^{}"), а не объект тега
+    name = candidates[0]
+    return refs.get(f"{name}^{{}}", refs[name])
+
+
+def current_commit(target_dir: Path) -> Optional[str]:
+    """Возвращает хэш текущего коммита локального клона или None."""
+    if not (target_dir / ".git").exists():
+        return None
+    result = subprocess.run(
+        ["git", "-C", str(target_dir), "rev-parse", "--verify", "-q", "HEAD"],
+        capture_output=True, text=True,
+    )
+    return result.stdout.strip() or None
 
 
-def clone_or_update_repo(repo_url: str, target_dir: Path) -> None:
-    """Клонирует или обновляет репозиторий."""
-    if target_dir.exists():
-        print(f"Updating {target_dir}...")
-        subprocess.run(["git", "-C", str(target_dir), "pull"], check=True)
-    else:
+def clone_or_update_repo(repo_url: str, target_dir: Path, commit: str,
+                         sparse_paths: tuple[str, ...] = ("svetlanna",)) -> None:
+    """Клонирует или обновляет репозиторий до указанного коммита.
+
+    Загружается только сам коммит (без истории) и только каталоги
+    из sparse_paths.
+    """
+    if current_commit(target_dir) == commit:
+        print(f"{target_dir} is already at {commit[:12]}")
+        return
+
+    git = ["git", "-C", str(target_dir)]
+    if not (target_dir / ".git").exists():
         print(f"Cloning {repo_url}...")
-        subprocess.run(["git", "clone", "--depth=1", repo_url, str(target_dir)], check=True)
+        target_dir.mkdir(parents=True, exist_ok=True)
+        subprocess.run(git + ["init", "-q"], check=True)
+        subprocess.run(git + ["remote", "add", "origin", repo_url], check=True)
+    else:
+        print(f"Updating {target_dir}...")
+        subprocess.run(git + ["remote", "set-url", "origin", repo_url], check=True)
+
+    subprocess.run(git + ["sparse-checkout", "set", *sparse_paths], check=True)
+    subprocess.run(
+        git + ["fetch", "-q", "--depth=1", "--filter=blob:none", "origin", commit],
+        check=True,
+    )
+    subprocess.run(git + ["checkout", "-q", "--force", "--detach", commit], check=True)
+
+
+def fetch_commit(target_dir: Path, commit: str) -> None:
+    """Загружает коммит в существующий клон без checkout (только деревья, без blob)."""
+    subprocess.run(
+        ["git", "-C", str(target_dir), "fetch", "-q", "--depth=1", "--filter=blob:none", "origin", commit],
+        check=True,
+    )
+
+
+def prefetch_blobs(target_dir: Path, commit: str, blob_ids: Iterable[str]) -> None:
+    """Загружает отсутствующие blob-объекты одним запросом.
+
+    Иначе partial clone загружал бы каждый blob отдельным запросом при
+    первом чтении через git cat-file.
+    """
+    git = ["git", "-C", str(target_dir)]
+    result = subprocess.run(
+        git + ["rev-list", "--objects", "--missing=print", commit],
+        check=True, capture_output=True, text=True,
+    )
+    missing = {line[1:] for line in result.stdout.splitlines() if line.startswith("?")}
+    missing.intersection_update(blob_ids)
+    if not missing:
+        return
+    subprocess.run(
+        git + ["fetch", "-q", "--no-tags", "--no-write-fetch-head", "--recurse-submodules=no",
+               "--filter=blob:none", "--stdin", "origin"],
+        input="\n".join(sorted(missing)), check=True, text=True,
+    )
+
+
+class GitObjectStore:
+    """Чтение объектов git через один долгоживущий процесс git cat-file --batch.
+
+    Позволяет читать файлы любого загруженного коммита без checkout.
+    """
+
+    def __init__(self, repo_dir: Path):
+        self.process = subprocess.Popen(
+            ["git", "-C", str(repo_dir), "cat-file", "--batch"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+        )
+
+    def read(self, spec: str) -> tuple[str, bytes]:
+        """Возвращает тип и содержимое объекта (id или "<коммит>:<путь>")."""
+        self.process.stdin.write(spec.encode("utf-8") + b"\n")
+        self.process.stdin.flush()
+        header = self.process.stdout.readline().split()
+        if len(header) != 3:
+            # "<spec> missing" или "<spec> ambiguous"
+            raise KeyError(spec)
+        _, object_type, size = header
+        data = self.process.stdout.read(int(size))
+        self.process.stdout.read(1)  # Перевод строки после содержимого
+        return object_type.decode("ascii"), data
+
+    def read_blob(self, blob_id: str) -> bytes:
+        """Возвращает содержимое blob-объекта."""
+        return self.read(blob_id)[1]
+
+    def list_files(self, commit: str, prefix: str = "svetlanna", suffix: str = ".py") -> dict[PurePosixPath, str]:
+        """Возвращает {путь: id blob} для файлов каталога prefix в коммите."""
+        files = {}
+        try:
+            trees = [(PurePosixPath(prefix), self.read(f"{commit}:{prefix}")[1])]
+        except KeyError:
+            return files
+
+        while trees:
+            path, data = trees.pop()
+            # Запись дерева: "<mode> <имя>\0<20 байт id>"
+            pos = 0
+            while pos < len(data):
+                space = data.index(b" ", pos)
+                nul = data.index(b"\0", space)
+                mode = data[pos:space]
+                name = data[space + 1:nul].decode("utf-8")
+                object_id = data[nul + 1:nul + 21].hex()
+                pos = nul + 21
+                if mode == b"40000":
+                    trees.append((path / name, self.read(object_id)[1]))
+                elif mode.startswith(b"100") and name.endswith(suffix):
+                    files[path / name] = object_id
+        return files
+
+    def close(self) -> None:
+        self.process.stdin.close()
+        # Рабочие процессы ProcessPoolExecutor, созданные через fork, наследуют
+        # дескриптор stdin, и git может не получить EOF — завершаем явно
+        self.process.terminate()
+        self.process.wait()
+
+
+def load_state(state_path: Path) -> dict:
+    """Загружает состояние последнего успешного запуска."""
+    try:
+        return json.loads(state_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def save_state(state_path: Path, state: dict) -> None:
+    """Сохраняет состояние успешного запуска."""
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    state_path.write_text(json.dumps(state, indent=2) + "\n", encoding="utf-8")
 
 
 def extract_docstring(node: ast.AST) -> Optional[str]:
@@ -34,35 +237,41 @@ def extract_docstring(node: ast.AST) -> Optional[str]:
     return None
 
 
+def format_argument(arg: ast.arg, default: Optional[ast.expr] = None, prefix: str = "") -> str:
+    """Форматирует аргумент сигнатуры: имя, аннотацию и значение по умолчанию."""
+    arg_str = prefix + arg.arg
+    if arg.annotation:
+        arg_str += f": {ast.unparse(arg.annotation)}"
+    if default is not None:
+        arg_str += f" = {ast.unparse(default)}"
+    return arg_str
+
+
 def extract_function_signature(node: ast.FunctionDef) -> str:
     """Извлекает сигнатуру функции."""
     args = []
 
-    # Positional args
-    for i, arg in enumerate(node.args.args):
-        arg_str = arg.arg
-        if arg.annotation:
-            arg_str += f": {ast.unparse(arg.annotation)}"
-        # Default values
-        defaults_offset = len(node.args.args) - len(node.args.defaults)
-        if i >= defaults_offset:
-            default = node.args.defaults[i - defaults_offset]
-            arg_str += f" = {ast.unparse(default)}"
-        args.append(arg_str)
-
-    # *args
+    # Positional-only and positional args (defaults cover the last of both)
+    positional = node.args.posonlyargs + node.args.args
+    defaults = [None] * (len(positional) - len(node.args.defaults)) + node.args.defaults
+    for i, (arg, default) in enumerate(zip(positional, defaults)):
+        args.append(format_argument(arg, default))
+        if i == len(node.args.posonlyargs) - 1:
+            args.append("/")
+
+    # *args, or a bare * before keyword-only args
     if node.args.vararg:
-        arg_str = f"*{node.args.vararg.arg}"
-        if node.args.vararg.annotation:
-            arg_str += f": {ast.unparse(node.args.vararg.annotation)}"
-        args.append(arg_str)
+        args.append(format_argument(node.args.vararg, prefix="*"))
+    elif node.args.kwonlyargs:
+        args.append("*")
+
+    # Keyword-only args
+    for arg, default in zip(node.args.kwonlyargs, node.args.kw_defaults):
+        args.append(format_argument(arg, default))
 
     # **kwargs
     if node.args.kwarg:
-        arg_str = f"**{node.args.kwarg.arg}"
-        if node.args.kwarg.annotation:
-            arg_str += f": {ast.unparse(node.args.kwarg.annotation)}"
-        args.append(arg_str)
+        args.append(format_argument(node.args.kwarg, prefix="**"))
 
     # Return type
     returns = ""
@@ -72,22 +281,119 @@ def extract_function_signature(node: ast.FunctionDef) -> str:
     return f"({', '.join(args)}){returns}"
 
 
-def parse_module(file_path: Path) -> dict:
+def is_overload(node: ast.FunctionDef) -> bool:
+    """Помечена ли функция @overload (или @typing.overload)."""
+    return any(
+        isinstance(d, ast.Name) and d.id == "overload"
+        or isinstance(d, ast.Attribute) and d.attr == "overload"
+        for d in node.decorator_list
+    )
+
+
+def merge_overloads(definitions: list[tuple[dict, bool]]) -> list[dict]:
+    """Сворачивает группы @overload в одну запись.
+
+    definitions — пары (описание функции, помечена ли она @overload).
+    Сигнатуры перегрузок попадают в "overloads" следующей за ними
+    реализации; если реализации нет, документируется последняя перегрузка.
+    """
+    result = []
+    pending: dict[str, list[dict]] = {}
+    for info, overload in definitions:
+        if overload:
+            pending.setdefault(info["name"], []).append(info)
+            continue
+        overloads = pending.pop(info["name"], None)
+        if overloads:
+            info["overloads"] = [item["signature"] for item in overloads]
+            if not info["docstring"]:
+                info["docstring"] = next((item["docstring"] for item in overloads if item["docstring"]), None)
+        result.append(info)
+
+    for overloads in pending.values():
+        info = overloads[-1]
+        info["overloads"] = [item["signature"] for item in overloads]
+        result.append(info)
+    return result
+
+
+def extract_all(node: ast.expr) -> list[str]:
+    """Имена из литерала списка или кортежа в __all__."""
+    try:
+        value = ast.literal_eval(node)
+    except ValueError:
+        return []
+    if isinstance(value, (list, tuple)):
+        return [name for name in value if isinstance(name, str)]
+    return []
+
+
+def top_level_statements(body: list[ast.stmt]) -> Iterator[ast.stmt]:
+    """Инструкции уровня модуля, включая ветви if/try (например, TYPE_CHECKING)."""
+    for node in body:
+        yield node
+        if isinstance(node, ast.If):
+            yield from top_level_statements(node.body)
+            yield from top_level_statements(node.orelse)
+        elif isinstance(node, ast.Try):
+            for block in (node.body, *(h.body for h in node.handlers), node.orelse, node.finalbody):
+                yield from top_level_statements(block)
+
+
+def parse_module(file_path: Path, cache: Optional["ParseCache"] = None) -> dict:
     """Парсит Python модуль и извлекает информацию о классах и функциях."""
+    if cache is not None:
+        return cache.parse(file_path)
+
     with open(file_path, "r", encoding="utf-8") as f:
         source = f.read()
 
+    return parse_source(source)
+
+
+def parse_source(source: str) -> dict:
+    """Парсит исходный код модуля и извлекает информацию о классах и функциях."""
     try:
         tree = ast.parse(source)
     except SyntaxError:
-        return {"classes": [], "functions": [], "docstring": None}
+        return {"classes": [], "functions": [], "docstring": None, "imports": [], "all": None}
 
     module_info = {
         "docstring": extract_docstring(tree),
         "classes": [],
         "functions": [],
+        # Относительные импорты [модуль, уровень, имя, псевдоним] и __all__ —
+        # по ним ExportResolver определяет публичные имена без импорта пакета
+        "imports": [],
+        "all": None,
     }
 
+    for node in top_level_statements(tree.body):
+        if isinstance(node, ast.ImportFrom) and node.level:
+            for alias in node.names:
+                module_info["imports"].append(
+                    [node.module or "", node.level, alias.name, alias.asname or alias.name]
+                )
+        elif isinstance(node, ast.Assign) and any(
+            isinstance(t, ast.Name) and t.id == "__all__" for t in node.targets
+        ):
+            module_info["all"] = extract_all(node.value)
+        elif isinstance(node, ast.AugAssign) and isinstance(node.target, ast.Name) and node.target.id == "__all__":
+            module_info["all"] = (module_info["all"] or []) + extract_all(node.value)
+        elif (
+            isinstance(node, ast.Expr)
+            and isinstance(node.value, ast.Call)
+            and isinstance(node.value.func, ast.Attribute)
+            and isinstance(node.value.func.value, ast.Name)
+            and node.value.func.value.id == "__all__"
+            and node.value.func.attr in ("append", "extend")
+            and node.value.args
+        ):
+            arg = node.value.args[0]
+            names = extract_all(arg) if node.value.func.attr == "extend" else extract_all(ast.List([arg]))
+            module_info["all"] = (module_info["all"] or []) + names
+
+    functions = []
     for node in ast.iter_child_nodes(tree):
         if isinstance(node, ast.ClassDef):
             class_info = {
@@ -97,6 +403,7 @@ def parse_module(file_path: Path) -> dict:
                 "bases": [ast.unparse(base) for base in node.bases],
             }
 
+            methods = []
             for item in node.body:
                 if isinstance(item, ast.FunctionDef):
                     method_info = {
@@ -116,8 +423,9 @@ def parse_module(file_path: Path) -> dict:
                             for d in item.decorator_list
                         ),
                     }
-                    class_info["methods"].append(method_info)
+                    methods.append((method_info, is_overload(item)))
 
+            class_info["methods"] = merge_overloads(methods)
             module_info["classes"].append(class_info)
 
         elif isinstance(node, ast.FunctionDef):
@@ -126,238 +434,905 @@ def parse_module(file_path: Path) -> dict:
                 "signature": extract_function_signature(node),
                 "docstring": extract_docstring(node),
             }
-            module_info["functions"].append(func_info)
+            functions.append((func_info, is_overload(node)))
 
+    module_info["functions"] = merge_overloads(functions)
     return module_info
 
 
-def format_docstring(docstring: Optional[str]) -> str:
-    """Форматирует docstring для MDX с поддержкой numpy-style."""
-    if not docstring or not isinstance(docstring, str):
-        return ""
+def git_blob_id(content: bytes) -> str:
+    """Возвращает id blob-объекта git для содержимого файла."""
+    return hashlib.sha1(b"blob %d\0" % len(content) + content).hexdigest()
+
+
+def timed_parse_source(source: str) -> tuple[float, dict]:
+    """parse_source вместе с временем парсинга в секундах."""
+    start = time.perf_counter()
+    module_info = parse_source(source)
+    return time.perf_counter() - start, module_info
+
+
+class ParseCache:
+    """Дисковый кэш результатов parse_module, ключ — хэш содержимого файла."""
+
+    def __init__(self, path: Path, salt: str = CACHE_SALT):
+        self.path = path
+        self.salt = salt
+        self.entries: dict[str, dict] = {}
+        self.used: set[str] = set()
+        self.hits = 0
+        self.misses = 0
+        # Время парсинга файлов, не найденных в кэше (для --timings)
+        self.parse_times: dict[Path, float] = {}
+
+        if path.exists():
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                data = {}
+            if data.get("salt") == salt:
+                self.entries = data.get("entries", {})
+
+    def key(self, content: bytes) -> str:
+        """Ключ кэша для содержимого файла рабочей копии."""
+        return self.blob_key(git_blob_id(content))
+
+    def blob_key(self, blob_id: str) -> str:
+        """Ключ кэша: sha256 от версии генератора и id blob-объекта git.
+
+        Файл рабочей копии и тот же файл в любой версии из git получают
+        один ключ, поэтому неизменённые между версиями файлы парсятся
+        один раз, а их содержимое из git даже не читается.
+        """
+        return hashlib.sha256(f"{self.salt}\0{blob_id}".encode("utf-8")).hexdigest()
+
+    def parse(self, file_path: Path) -> dict:
+        """Возвращает результат parse_module из кэша или парсит файл заново."""
+        content = file_path.read_bytes()
+        key = self.key(content)
+        self.used.add(key)
+
+        if key in self.entries:
+            self.hits += 1
+        else:
+            self.misses += 1
+            self.entries[key] = parse_source(content.decode("utf-8"))
+
+        # Вызывающий код дополняет списки classes/functions — отдаём копию
+        return copy.deepcopy(self.entries[key])
+
+    def parse_many(self, file_paths: list[Path], executor: Optional[Executor] = None) -> list[dict]:
+        """Как parse, но для набора файлов; промахи кэша парсятся через executor."""
+        keys = []
+        pending: dict[str, str] = {}
+        pending_paths: dict[str, Path] = {}
+        for file_path in file_paths:
+            content = file_path.read_bytes()
+            key = self.key(content)
+            keys.append(key)
+            self.used.add(key)
+            if key in self.entries or key in pending:
+                self.hits += 1
+            else:
+                self.misses += 1
+                pending[key] = content.decode("utf-8")
+                pending_paths[key] = file_path
+
+        self.parse_pending(pending, pending_paths, executor)
+        return [copy.deepcopy(self.entries[key]) for key in keys]
+
+    def parse_blobs(self, files: dict[PurePosixPath, str], read: Callable[[str], bytes],
+                    executor: Optional[Executor] = None) -> list[dict]:
+        """Как parse_many, но для файлов из git: {путь: id blob}.
+
+        Содержимое читается через read только для промахов кэша.
+        """
+        keys = []
+        pending: dict[str, str] = {}
+        pending_paths: dict[str, PurePosixPath] = {}
+        for file_path, blob_id in files.items():
+            key = self.blob_key(blob_id)
+            keys.append(key)
+            self.used.add(key)
+            if key in self.entries or key in pending:
+                self.hits += 1
+            else:
+                self.misses += 1
+                pending[key] = read(blob_id).decode("utf-8")
+                pending_paths[key] = file_path
+
+        self.parse_pending(pending, pending_paths, executor)
+        return [copy.deepcopy(self.entries[key]) for key in keys]
+
+    def parse_pending(self, pending: dict[str, str], pending_paths: dict[str, PurePosixPath],
+                      executor: Optional[Executor] = None) -> None:
+        """Парсит промахи кэша {ключ: исходный код}, при наличии executor — параллельно."""
+        run = executor.map if executor is not None else map
+        for key, (elapsed, module_info) in zip(pending, run(timed_parse_source, pending.values())):
+            self.entries[key] = module_info
+            self.parse_times[pending_paths[key]] = elapsed
+
+    def save(self) -> None:
+        """Сохраняет кэш, удаляя записи, не использованные в этом запуске."""
+        self.entries = {k: v for k, v in self.entries.items() if k in self.used}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(
+            json.dumps({"salt": self.salt, "entries": self.entries}, ensure_ascii=False),
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, self.path)
+
+
+# Секции numpy docstring и способ их разбора:
+# entries — список "name : type" с описаниями, see_also — ссылки на другие
+# объекты, text — свободный текст, examples — текст с doctest-блоками
+DOCSTRING_SECTIONS = {
+    "Parameters": "entries",
+    "Other Parameters": "entries",
+    "Returns": "entries",
+    "Yields": "entries",
+    "Receives": "entries",
+    "Raises": "entries",
+    "Warns": "entries",
+    "Attributes": "entries",
+    "Methods": "entries",
+    "See Also": "see_also",
+    "Notes": "text",
+    "Warnings": "text",
+    "References": "text",
+    "Examples": "examples",
+}
 
-    # Убираем лишние отступы
-    lines = docstring.strip().split("\n")
-    if len(lines) > 1:
-        # Определяем минимальный отступ (кроме первой строки)
-        min_indent = float("inf")
-        for line in lines[1:]:
-            if line.strip():
-                indent = len(line) - len(line.lstrip())
-                min_indent = min(min_indent, indent)
+# Секции, в которых элемент без " : " — это имя без типа, а не тип
+NAMED_SECTIONS = {"Parameters", "Other Parameters", "Receives", "Attributes", "Methods"}
 
-        if min_indent < float("inf"):
-            lines = [lines[0]] + [line[int(min_indent):] if len(line) > min_indent else line for line in lines[1:]]
+# Заголовки <details> для секций, которые выводятся раскрывающимися блоками
+DETAILS_SECTIONS = {
+    "Parameters": ("📥 Параметры", True),
+    "Returns": ("📤 Возвращает", True),
+    "Raises": ("⚠️ Исключения", False),
+    "Warns": ("⚠️ Предупреждения", False),
+}
 
-    # Парсим numpy-style docstring
-    result_lines = []
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        stripped = line.strip()
 
-        # Определяем секции numpy docstring
-        if stripped in ("Parameters", "Returns", "Raises", "Yields", "Examples", "Notes", "Attributes"):
-            # Проверяем следующую строку на ---
-            if i + 1 < len(lines) and lines[i + 1].strip().startswith("---"):
-                section_name = stripped
-                i += 2  # Пропускаем заголовок и ---
-
-                # Собираем все параметры секции
-                params = []
-                while i < len(lines):
-                    param_line = lines[i]
-                    param_stripped = param_line.strip()
-
-                    # Пустая строка
-                    if not param_stripped:
-                        i += 1
-                        continue
-
-                    # Новая секция - выходим
-                    if param_stripped in ("Parameters", "Returns", "Raises", "Yields", "Examples", "Notes", "Attributes"):
-                        break
-
-                    # Проверяем формат "name : type"
-                    if " : " in param_line and not param_line.startswith("    "):
-                        parts = param_stripped.split(" : ", 1)
-                        param_name = parts[0]
-                        param_type = parts[1] if len(parts) > 1 else ""
-
-                        # Собираем описание
-                        i += 1
-                        desc_lines = []
-                        while i < len(lines):
-                            desc_line = lines[i]
-                            desc_stripped = desc_line.strip()
-                            if desc_line.startswith("    ") or desc_line.startswith("  "):
-                                desc_lines.append(desc_stripped)
-                                i += 1
-                            elif not desc_stripped:
-                                i += 1
-                                break
-                            else:
-                                break
-
-                        desc_text = " ".join(desc_lines) if desc_lines else ""
-                        params.append((param_name, param_type, desc_text))
-                    else:
-                        # Просто тип (для Returns)
-                        type_name = param_stripped
-                        i += 1
-                        desc_lines = []
-                        while i < len(lines):
-                            desc_line = lines[i]
-                            desc_stripped = desc_line.strip()
-                            if desc_line.startswith("    ") or desc_line.startswith("  "):
-                                desc_lines.append(desc_stripped)
-                                i += 1
-                            elif not desc_stripped:
-                                i += 1
-                                break
-                            else:
-                                break
-
-                        desc_text = " ".join(desc_lines) if desc_lines else ""
-                        params.append((None, type_name, desc_text))
-
-                # Генерируем вывод для секции
-                if params:
-                    if section_name == "Parameters":
-                        result_lines.append("\n<details open>")
-                        result_lines.append(f"<summary className=\"cursor-pointer font-semibold text-sm py-2\">📥 Параметры</summary>\n")
-                        result_lines.append("| Параметр | Тип | Описание |")
-                        result_lines.append("|:---------|:----|:---------|")
-                        for name, ptype, desc in params:
-                            # Экранируем | в описании
-                            desc_safe = desc.replace("|", "\\|")
-                            result_lines.append(f"| `{name}` | `{ptype}` | {desc_safe} |")
-                        result_lines.append("\n</details>\n")
-                    elif section_name == "Returns":
-                        result_lines.append("\n<details open>")
-                        result_lines.append(f"<summary className=\"cursor-pointer font-semibold text-sm py-2\">📤 Возвращает</summary>\n")
-                        for name, ptype, desc in params:
-                            if name:
-                                result_lines.append(f"**`{name}`** : `{ptype}`")
-                            else:
-                                result_lines.append(f"**`{ptype}`**")
-                            if desc:
-                                result_lines.append(f"\n{desc}\n")
-                        result_lines.append("\n</details>\n")
-                    elif section_name == "Raises":
-                        result_lines.append("\n<details>")
-                        result_lines.append(f"<summary className=\"cursor-pointer font-semibold text-sm py-2\">⚠️ Исключения</summary>\n")
-                        for name, ptype, desc in params:
-                            if name:
-                                result_lines.append(f"- **`{name}`** : `{ptype}` — {desc}")
-                            else:
-                                result_lines.append(f"- **`{ptype}`** — {desc}")
-                        result_lines.append("\n</details>\n")
-                    else:
-                        # Другие секции - простой список
-                        result_lines.append(f"\n**{section_name}**\n")
-                        for name, ptype, desc in params:
-                            if name:
-                                result_lines.append(f"- `{name}` : *{ptype}* — {desc}")
-                            else:
-                                result_lines.append(f"- *{ptype}* — {desc}")
+@dataclass(slots=True)
+class DocEntry:
+    """Элемент секции: параметр, возвращаемое значение, исключение и т.п."""
+    name: Optional[str]
+    type: str
+    paragraphs: list[list[str]] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class DocSection:
+    """Секция numpy docstring."""
+    title: str
+    kind: str
+    entries: list[DocEntry] = field(default_factory=list)
+    lines: list[str] = field(default_factory=list)
+
+
+def escape_mdx(text: str) -> str:
+    """Экранирует фигурные скобки для MDX."""
+    return text.replace("{", "&#123;").replace("}", "&#125;")
+
+
+# Непустая строка без отступа и отступы непустых строк
+UNINDENTED_PATTERN = re.compile(r"\n\S")
+INDENT_PATTERN = re.compile(r"\n([^\S\n]*)\S")
+
+
+def dedent_docstring(docstring: str) -> str:
+    """Убирает общий отступ у всех строк docstring, кроме первой.
+
+    Отступы ищутся и срезаются регулярными выражениями, без цикла по строкам.
+    """
+    text = docstring.strip()
+    if UNINDENTED_PATTERN.search(text):
+        return text
+    min_indent = min(map(len, INDENT_PATTERN.findall(text)), default=0)
+    if not min_indent:
+        return text
+
+    # Обычный случай — отступ из пробелов: срезаем его одной заменой
+    prefix = "\n" + " " * min_indent
+    if "\t" not in text and prefix + "\n" not in text and not text.endswith(prefix):
+        return text.replace(prefix, "\n")
+    # Строки не длиннее общего отступа (пустые) остаются как есть
+    return re.sub(rf"\n[^\S\n]{{{min_indent}}}(?=[^\n])", "\n", text)
+
+
+def find_sections(text: str) -> list[tuple[int, int, int, str]]:
+    """Находит заголовки секций: имя секции и подчёркивание "---" под ним.
+
+    Ищет только строки подчёркивания, поэтому весь текст просматривается
+    один раз средствами str.find. Возвращает кортежи (начало заголовка,
+    начало тела секции, отступ заголовка, название).
+    """
+    sections = []
+    pos = text.find("---")
+    while pos != -1:
+        line_start = text.rfind("\n", 0, pos) + 1
+        line_end = text.find("\n", pos)
+        if line_end == -1:
+            line_end = len(text)
+
+        if line_start > 0 and not text[line_start:pos].strip():
+            header_start = text.rfind("\n", 0, line_start - 1) + 1
+            header = text[header_start:line_start - 1]
+            title = header.strip()
+            if title in DOCSTRING_SECTIONS:
+                indent = len(header) - len(header.lstrip())
+                sections.append((header_start, line_end + 1, indent, title))
+
+        pos = text.find("---", line_end)
+    return sections
+
+
+def parse_entries(section: DocSection, lines: list[str], section_indent: int) -> None:
+    """Разбирает строки секции со списком элементов "name : type"."""
+    see_also = section.kind == "see_also"
+    named = section.title in NAMED_SECTIONS
+    append_entry = section.entries.append
+    # Строка с отступом больше section_indent начинается с deeper пробельных символов
+    deeper = section_indent + 1
+    paragraph: Optional[list[str]] = None
+    paragraphs: Optional[list[list[str]]] = None
+    blank = False
+
+    for line in lines:
+        stripped = line.strip()
+        if not stripped:
+            blank = True
+            continue
+
+        if paragraphs is not None and line[:deeper].isspace():
+            # Продолжение описания; пустая строка начинает новый абзац
+            if blank or paragraph is None:
+                paragraph = []
+                paragraphs.append(paragraph)
+            paragraph.append(stripped)
+            blank = False
+            continue
+
+        blank = False
+        if " : " in stripped:
+            name, type_name = stripped.split(" : ", 1)
+            if see_also:
+                paragraph = [type_name]
+                entry = DocEntry(name, "", [paragraph])
+            else:
+                paragraph = None
+                entry = DocEntry(name, type_name)
+            append_entry(entry)
+        elif see_also:
+            # Перечисление имён через запятую
+            see_names = [see_name.strip() for see_name in stripped.split(",")]
+            see_names = [see_name for see_name in see_names if see_name]
+            if not see_names:
                 continue
+            for see_name in see_names:
+                entry = DocEntry(see_name, "")
+                append_entry(entry)
+            paragraph = None
+        else:
+            paragraph = None
+            entry = DocEntry(stripped, "") if named else DocEntry(None, stripped)
+            append_entry(entry)
+        paragraphs = entry.paragraphs
+
+
+def parse_docstring(docstring: str) -> list:
+    """Разбирает numpy-style docstring за один проход.
+
+    Возвращает последовательность блоков: свободный текст (str) и секции
+    (DocSection) в порядке их появления.
+    """
+    text = dedent_docstring(docstring)
+    sections = find_sections(text)
+    if not sections:
+        return [text]
+
+    blocks: list = []
+    if sections[0][0] > 0:
+        blocks.append(text[:sections[0][0] - 1])
+
+    for index, (_, body_start, section_indent, title) in enumerate(sections):
+        body_end = sections[index + 1][0] if index + 1 < len(sections) else len(text)
+        lines = text[body_start:body_end].split("\n")
+        section = DocSection(title, DOCSTRING_SECTIONS[title])
+
+        if section.kind in ("text", "examples"):
+            section.lines = [line[section_indent:] for line in lines] if section_indent else lines
+        else:
+            parse_entries(section, lines, section_indent)
+        blocks.append(section)
+
+    return blocks
+
+
+def render_text_section(section: DocSection) -> str:
+    """Генерирует MDX для секции со свободным текстом или примерами."""
+    # Убираем пустые строки по краям секции
+    lines = section.lines
+    start, end = 0, len(lines)
+    while start < end and not lines[start].strip():
+        start += 1
+    while end > start and not lines[end - 1].strip():
+        end -= 1
+    if start == end:
+        return ""
 
-        result_lines.append(line)
-        i += 1
+    if section.kind == "text":
+        return f"\n**{section.title}**\n\n" + "\n".join(lines[start:end])
+
+    # Doctest-строки примеров выводим блоками кода без экранирования;
+    # текст между ними экранируется целыми фрагментами, а не построчно
+    result_lines = [f"\n**{section.title}**\n"]
+    prose: list[str] = []
+    in_code = False
+    for line in lines[start:end]:
+        if line.startswith((">>>", "...")) or (in_code and line.strip()):
+            if not in_code:
+                if prose:
+                    result_lines.append(escape_mdx("\n".join(prose)))
+                    prose = []
+                result_lines.append("```python")
+                in_code = True
+            result_lines.append(line)
+        else:
+            if in_code:
+                result_lines.append("```")
+                in_code = False
+            prose.append(line)
+    if in_code:
+        result_lines.append("```")
+    elif prose:
+        result_lines.append(escape_mdx("\n".join(prose)))
+    return "\n".join(result_lines)
+
+
+def render_section(section: DocSection, symbols: Optional["SymbolTable"] = None) -> str:
+    """Генерирует MDX для секции docstring.
+
+    Фигурные скобки экранируются только в примерах (вне блоков кода),
+    остальные секции экранирует format_docstring. С symbols известные
+    типы и имена в See Also становятся ссылками.
+    """
+    if section.kind in ("text", "examples"):
+        return render_text_section(section)
+
+    if not section.entries:
+        return ""
 
-    result = "\n".join(result_lines)
+    result_lines = []
+    details = DETAILS_SECTIONS.get(section.title)
+    if details:
+        summary, is_open = details
+        result_lines.append("\n<details open>" if is_open else "\n<details>")
+        result_lines.append(f"<summary className=\"cursor-pointer font-semibold text-sm py-2\">{summary}</summary>\n")
+    else:
+        result_lines.append(f"\n**{section.title}**\n")
+
+    if section.title == "Parameters":
+        result_lines.append("| Параметр | Тип | Описание |")
+        result_lines.append("|:---------|:----|:---------|")
+
+    code = symbols.link_type if symbols is not None else lambda text: f"`{text}`"
+    append = result_lines.append
+
+    # Вид секции проверяется один раз, а не для каждого элемента
+    if section.title == "Parameters":
+        for entry in section.entries:
+            # Экранируем | в ячейках таблицы
+            type_cell = code(entry.type).replace("|", "\\|") if entry.type else ""
+            desc_cell = "<br/><br/>".join([" ".join(paragraph) for paragraph in entry.paragraphs]).replace("|", "\\|")
+            append(f"| `{entry.name}` | {type_cell} | {desc_cell} |")
+    elif section.title == "Returns":
+        for entry in section.entries:
+            append(f"**`{entry.name}`** : {code(entry.type)}" if entry.name else f"**{code(entry.type)}**")
+            if entry.paragraphs:
+                append("\n" + "\n\n".join([" ".join(paragraph) for paragraph in entry.paragraphs]) + "\n")
+    else:
+        see_also = section.kind == "see_also"
+        for entry in section.entries:
+            name, ptype = entry.name, entry.type
+            desc = "\n\n  ".join([" ".join(paragraph) for paragraph in entry.paragraphs])
+            if details:
+                item = f"**`{name}`** : {code(ptype)}" if name else f"**{code(ptype)}**"
+                append(f"- {item} — {desc}")
+            elif see_also:
+                append(f"- {code(name)} — {desc}" if desc else f"- {code(name)}")
+            elif name:
+                append(f"- `{name}` : *{ptype}* — {desc}")
+            else:
+                append(f"- *{ptype}* — {desc}")
+
+    if details:
+        result_lines.append("\n</details>\n")
+
+    return "\n".join(result_lines)
+
+
+# Формулы: $$...$$ (блочные) и $...$ (строчные), кроме экранированных \$
+MATH_PATTERN = re.compile(r"\$\$(.+?)\$\$|(?<!\\)\$([^$\n]+?)\$", re.DOTALL)
+
+# Атрибут, которым вставляется готовый HTML формулы (по нему же считается вес страницы)
+MATH_ATTRIBUTE = "dangerouslySetInnerHTML="
+
+# Метка формулы, которая проходит разбор и экранирование docstring без изменений
+MATH_PLACEHOLDER = re.compile("\ue000(\\d+)\ue001")
+
+
+def find_math(text: str) -> Iterator[tuple[re.Match, str]]:
+    """Формулы текста и их ключи ("$$tex" или "$tex"); строки doctest пропускаются."""
+    for match in MATH_PATTERN.finditer(text):
+        line_start = text.rfind("\n", 0, match.start()) + 1
+        if text[line_start:match.start()].lstrip().startswith((">>>", "...")):
+            continue
+        display, inline = match.groups()
+        yield match, f"$${display}" if display is not None else f"${inline}"
+
+
+def math_jsx(html: str) -> str:
+    """Вставляет готовый HTML формулы в MDX; | экранируется, чтобы не ломать таблицы."""
+    data = json.dumps(html).replace("|", "\\u007c")
+    return f"<span {MATH_ATTRIBUTE}{{{{ __html: {data} }}}} />"
+
+
+class MathRenderer:
+    """Рендерит формулы в HTML через katex в одном долгоживущем процессе node.
+
+    Результаты хранятся в кэше на диске по тексту формулы, поэтому node
+    запускается, только если в кэше чего-то нет. Кэш сбрасывается при
+    смене версии katex, его настроек или скрипта lib/render-math.js.
+    """
+
+    def __init__(self, project_root: Path, cache_path: Path):
+        self.script = project_root / "lib" / "render-math.js"
+        katex_package = project_root / "node_modules" / "katex" / "package.json"
+        if not katex_package.exists():
+            sys.exit("katex is not installed, run pnpm install (needed for --prerender-math)")
+        digest = hashlib.sha256()
+        for path in (self.script, project_root / "lib" / "katex-options.js"):
+            digest.update(path.read_bytes())
+        self.stamp = f"{json.loads(katex_package.read_text(encoding='utf-8'))['version']}-{digest.hexdigest()[:16]}"
+
+        self.cache_path = cache_path
+        self.entries: dict[str, Optional[str]] = {}
+        self.used: set[str] = set()
+        self.hits = 0
+        self.misses = 0
+        self.process: Optional[subprocess.Popen] = None
+        try:
+            data = json.loads(cache_path.read_text(encoding="utf-8"))
+            if data.get("stamp") == self.stamp:
+                self.entries = data["entries"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def render(self, key: str) -> Optional[str]:
+        """HTML формулы по ключу из find_math или None, если katex её не разобрал."""
+        self.used.add(key)
+        if key in self.entries:
+            self.hits += 1
+            return self.entries[key]
+
+        if self.process is None:
+            self.process = subprocess.Popen(
+                ["node", str(self.script)],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True, encoding="utf-8",
+            )
+        display = key.startswith("$$")
+        request = {"tex": key[2:] if display else key[1:], "display": display}
+        self.process.stdin.write(json.dumps(request) + "\n")
+        self.process.stdin.flush()
+        line = self.process.stdout.readline()
+        if not line:
+            raise RuntimeError(f"{self.script.name} exited unexpectedly")
+
+        result = json.loads(line)
+        html = result.get("html")
+        if html is None:
+            print(f"Warning: KaTeX cannot render {key!r}: {result['error']}")
+        self.entries[key] = html
+        self.misses += 1
+        return html
+
+    def render_modules(self, modules: Iterable["ApiModule"]) -> dict[str, Optional[str]]:
+        """Рендерит все формулы из docstrings модулей: {ключ: HTML}."""
+        return {
+            key: self.render(key)
+            for module_info in modules
+            for docstring in module_docstrings(module_info)
+            for _, key in find_math(docstring)
+        }
+
+    def save(self) -> None:
+        """Сохраняет кэш, оставляя только формулы, которые встретились в этом запуске."""
+        entries = {key: html for key, html in self.entries.items() if key in self.used}
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self.cache_path.write_text(json.dumps({"stamp": self.stamp, "entries": entries}), encoding="utf-8")
+
+    def close(self) -> None:
+        if self.process is not None:
+            self.process.stdin.close()
+            self.process.wait()
+            self.process = None
+
+
+@dataclass(slots=True)
+class RenderContext:
+    """Общие данные рендера страниц модуля.
+
+    symbols — таблица символов версии, math — готовый HTML формул,
+    inherited — унаследованные члены классов модуля по имени класса.
+    """
+    symbols: Optional["SymbolTable"] = None
+    math: dict[str, Optional[str]] = field(default_factory=dict)
+    inherited: dict[str, list["InheritedMembers"]] = field(default_factory=dict)
+
+
+def format_docstring(docstring: Optional[str], context: Optional[RenderContext] = None) -> str:
+    """Форматирует docstring для MDX с поддержкой numpy-style.
+
+    С context известные типы становятся ссылками, а формулы, для которых
+    есть готовый HTML, вставляются без повторного рендера в браузере.
+    Результат запоминается в FORMAT_CACHE: формулы вырезаются до поиска
+    в кэше, поэтому он не зависит от их HTML.
+    """
+    if not docstring or not isinstance(docstring, str):
+        return ""
 
-    # Экранируем фигурные скобки для MDX
-    result = result.replace("{", "&#123;").replace("}", "&#125;")
+    start = time.perf_counter()
+    symbols = context.symbols if context is not None else None
+
+    # Formulas are cut out before parsing so that escaping does not touch TeX
+    formulas = []
+    if context is not None and context.math:
+        pieces = []
+        pos = 0
+        for match, key in find_math(docstring):
+            html = context.math.get(key)
+            if html is None:
+                continue
+            pieces += [docstring[pos:match.start()], f"\ue000{len(formulas)}\ue001"]
+            formulas.append(html)
+            pos = match.end()
+        docstring = "".join(pieces) + docstring[pos:]
+
+    cache_key = (symbols.key if symbols is not None else None, docstring)
+    result = FORMAT_CACHE.get(cache_key)
+    if result is None:
+        result = render_docstring(docstring, symbols)
+        if len(FORMAT_CACHE) >= FORMAT_CACHE_SIZE:
+            FORMAT_CACHE.clear()
+        FORMAT_CACHE[cache_key] = result
+    else:
+        FORMAT_STATS["hits"] += 1
+    if formulas:
+        result = MATH_PLACEHOLDER.sub(lambda match: math_jsx(formulas[int(match.group(1))]), result)
 
+    FORMAT_STATS["calls"] += 1
+    FORMAT_STATS["seconds"] += time.perf_counter() - start
     return result
 
 
-def generate_class_mdx(class_info: dict, heading_level: int = 3) -> str:
-    """Генерирует MDX для класса с улучшенным форматированием."""
+def render_docstring(docstring: str, symbols: Optional["SymbolTable"] = None) -> str:
+    """Разбирает docstring и выводит его секции как экранированный MDX."""
+    parts = []
+    pending = []  # Текст, который ещё нужно экранировать
+    for block in parse_docstring(docstring):
+        if not isinstance(block, DocSection):
+            pending.append(block)
+            continue
+
+        rendered = render_section(block, symbols)
+        if not rendered:
+            continue
+        if block.kind == "examples":
+            # Код примеров не экранируется, поэтому выводим его отдельно
+            if pending:
+                parts.append(escape_mdx("\n".join(pending)))
+                pending = []
+            parts.append(rendered)
+        else:
+            pending.append(rendered)
+
+    if pending:
+        parts.append(escape_mdx("\n".join(pending)))
+
+    return "\n".join(parts)
+
+
+@dataclass(slots=True)
+class ApiFunction:
+    """Функция модуля; overloads — сигнатуры перегрузок @overload."""
+    name: str
+    signature: str
+    docstring: Optional[str] = None
+    overloads: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_info(cls, info: dict) -> "ApiFunction":
+        return cls(info["name"], info["signature"], info.get("docstring"), info.get("overloads", []))
+
+    def to_info(self) -> dict:
+        info = {"name": self.name, "signature": self.signature}
+        if self.docstring:
+            info["docstring"] = self.docstring
+        if self.overloads:
+            info["overloads"] = self.overloads
+        return info
+
+
+@dataclass(slots=True)
+class ApiMethod:
+    """Метод класса; overloads — сигнатуры перегрузок @overload."""
+    name: str
+    signature: str
+    docstring: Optional[str] = None
+    is_classmethod: bool = False
+    is_staticmethod: bool = False
+    is_property: bool = False
+    overloads: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_info(cls, info: dict) -> "ApiMethod":
+        return cls(
+            info["name"], info["signature"], info.get("docstring"),
+            info.get("is_classmethod", False), info.get("is_staticmethod", False), info.get("is_property", False),
+            info.get("overloads", []),
+        )
+
+    def to_info(self) -> dict:
+        info = {"name": self.name, "signature": self.signature}
+        if self.docstring:
+            info["docstring"] = self.docstring
+        for flag in ("is_classmethod", "is_staticmethod", "is_property"):
+            if getattr(self, flag):
+                info[flag] = True
+        if self.overloads:
+            info["overloads"] = self.overloads
+        return info
+
+
+@dataclass(slots=True)
+class ApiClass:
+    """Класс с методами, разбитыми на свойства, фабричные и обычные методы.
+
+    Разбиение вычисляется один раз при создании, а не в каждом рендерере.
+    """
+    name: str
+    docstring: Optional[str]
+    bases: list[str]
+    methods: list[ApiMethod]
+    properties: list[ApiMethod] = field(init=False)
+    classmethods: list[ApiMethod] = field(init=False)
+    # Обычные методы, включая __init__
+    public_methods: list[ApiMethod] = field(init=False)
+    init: Optional[ApiMethod] = field(init=False)
+
+    def __post_init__(self):
+        public = [m for m in self.methods if not m.name.startswith("_")]
+        self.properties = [m for m in public if m.is_property]
+        self.classmethods = [m for m in public if m.is_classmethod]
+        self.public_methods = [
+            m for m in self.methods
+            if m.name == "__init__"
+            or not m.name.startswith("_") and not (m.is_property or m.is_classmethod or m.is_staticmethod)
+        ]
+        self.init = next((m for m in self.methods if m.name == "__init__"), None)
+
+    @property
+    def method_count(self) -> int:
+        """Число фабричных и обычных методов без конструктора."""
+        return len(self.classmethods) + len(self.public_methods) - (self.init in self.public_methods)
+
+    @classmethod
+    def from_info(cls, info: dict) -> "ApiClass":
+        return cls(
+            info["name"], info.get("docstring"), info.get("bases", []),
+            [ApiMethod.from_info(m) for m in info["methods"]],
+        )
+
+    def to_info(self) -> dict:
+        info = {"name": self.name, "methods": [m.to_info() for m in self.methods]}
+        if self.docstring:
+            info["docstring"] = self.docstring
+        if self.bases:
+            info["bases"] = self.bases
+        return info
+
+
+@dataclass(slots=True)
+class ApiModule:
+    """Модуль документации: страница core, публичный модуль корня пакета
+    (svetlanna.detector) или (вложенный) подпакет svetlanna.
+
+    Имя вложенного подпакета записывается через точку: "elements.lenses".
+    internal_classes — неэкспортируемые классы файлов модуля: они не
+    документируются, но нужны ClassHierarchy для порядка MRO.
+    """
+    name: str
+    docstring: Optional[str]
+    classes: list[ApiClass]
+    functions: list[ApiFunction]
+    internal_classes: list[ApiClass] = field(default_factory=list)
+    public_functions: list[ApiFunction] = field(init=False)
+
+    def __post_init__(self):
+        self.public_functions = [f for f in self.functions if not f.name.startswith("_")]
+
+    @property
+    def title(self) -> str:
+        return self.name.rsplit(".", 1)[-1].replace("_", " ").title()
+
+    @property
+    def path(self) -> str:
+        """Каталог страниц модуля: вложенные подпакеты лежат в каталогах родителей."""
+        return self.name.replace(".", "/")
+
+    @property
+    def package(self) -> str:
+        """Имя пакета Python, из которого импортируются объекты модуля."""
+        return "svetlanna" if self.name == "core" else f"svetlanna.{self.name}"
+
+    @classmethod
+    def from_info(cls, name: str, info: dict) -> "ApiModule":
+        return cls(
+            name, info.get("docstring"),
+            [ApiClass.from_info(c) for c in info["classes"]],
+            [ApiFunction.from_info(f) for f in info["functions"]],
+            [ApiClass.from_info(c) for c in info.get("internal_classes", [])],
+        )
+
+    def to_info(self) -> dict:
+        info = {
+            "name": self.name,
+            "classes": [c.to_info() for c in self.classes],
+            "functions": [f.to_info() for f in self.functions],
+        }
+        if self.internal_classes:
+            info["internal_classes"] = [c.to_info() for c in self.internal_classes]
+        if self.docstring:
+            info["docstring"] = self.docstring
+        return info
+
+
+# Версия формата файла модели API (save_api_model)
+API_MODEL_VERSION = 2
+
+
+def save_api_model(path: Path, modules: list[ApiModule], version_modules: list = (),
+                   commit: Optional[str] = None) -> bool:
+    """Сохраняет модель API в компактный JSON для других инструментов.
+
+    Поля со значениями по умолчанию (пустые docstrings, False) не пишутся.
+    Возвращает True, если файл изменился.
+    """
+    data = {
+        "version": API_MODEL_VERSION,
+        "commit": commit,
+        "modules": [module.to_info() for module in modules],
+        "versions": {slug: [module.to_info() for module in mods] for slug, mods in version_modules},
+    }
+    return update_file(path, json.dumps(data, ensure_ascii=False, separators=(",", ":")))
+
+
+def generate_class_mdx(class_info: ApiClass, heading_level: int = 3,
+                       context: Optional[RenderContext] = None) -> str:
+    """Генерирует MDX для класса с улучшенным форматированием.
+
+    С context базовые классы и типы становятся ссылками на их определения.
+    """
     h = "#" * heading_level
     h_method = "#" * (heading_level + 1)
+    symbols = context.symbols if context is not None else None
 
-    lines = [f"{h} {class_info['name']}"]
+    lines = [f"{h} {class_info.name}"]
 
     # Badges для наследования
-    if class_info["bases"]:
-        bases_badges = " ".join([f"`{b}`" for b in class_info["bases"]])
-        lines.append(f"\n<small>Наследует: {bases_badges}</small>")
+    if class_info.bases:
+        code = symbols.link_type if symbols is not None else lambda text: f"`{text}`"
+        bases_badges = " ".join([code(b) for b in class_info.bases])
+        lines.append(f"\n<small {PAGEFIND_IGNORE}>Наследует: {bases_badges}</small>")
 
-    if class_info["docstring"]:
-        lines.append(f"\n{format_docstring(class_info['docstring'])}")
+    if class_info.docstring:
+        lines.append(f"\n{format_docstring(class_info.docstring, context)}")
 
     # Properties в карточках
-    properties = [m for m in class_info["methods"] if m["is_property"] and not m["name"].startswith("_")]
-    if properties:
+    if class_info.properties:
         lines.append(f"\n{h_method} Свойства\n")
         lines.append("<div className=\"grid grid-cols-1 md:grid-cols-2 gap-4 my-4\">")
-        for prop in properties:
-            doc = format_docstring(prop["docstring"]) if prop["docstring"] else ""
+        for prop in class_info.properties:
+            doc = format_docstring(prop.docstring, context) if prop.docstring else ""
             # Извлекаем первую строку описания
             first_line = doc.split("\n")[0] if doc else ""
             lines.append(f"""
-<div className="border rounded-lg p-4 dark:border-neutral-700">
-  <code className="text-sm font-semibold">{prop['name']}</code>
+<div id="{class_info.name}.{prop.name}" className="border rounded-lg p-4 dark:border-neutral-700">
+  <code className="text-sm font-semibold">{prop.name}</code>
   <p className="text-sm text-gray-600 dark:text-gray-400 mt-1">{first_line}</p>
 </div>""")
         lines.append("</div>\n")
 
-    # Class methods (factories)
-    classmethods = [m for m in class_info["methods"]
-                    if m["is_classmethod"] and not m["name"].startswith("_")]
-    if classmethods:
+    if class_info.classmethods:
         lines.append(f"\n{h_method} Фабричные методы\n")
-        for method in classmethods:
-            lines.append(generate_method_mdx(method, "classmethod"))
-
-    # Regular methods
-    public_methods = [m for m in class_info["methods"]
-                      if not m["name"].startswith("_")
-                      and not m["is_property"]
-                      and not m["is_classmethod"]
-                      and not m["is_staticmethod"]
-                      or m["name"] == "__init__"]
-
-    if public_methods:
+        for method in class_info.classmethods:
+            lines.append(generate_method_mdx(method, "classmethod", f"{class_info.name}.{method.name}", context))
+
+    if class_info.public_methods:
         lines.append(f"\n{h_method} Методы\n")
-        for method in public_methods:
-            badge = "constructor" if method["name"] == "__init__" else None
-            lines.append(generate_method_mdx(method, badge))
+        for method in class_info.public_methods:
+            badge = "constructor" if method is class_info.init else None
+            lines.append(generate_method_mdx(method, badge, f"{class_info.name}.{method.name}", context))
+
+    inherited = context.inherited.get(class_info.name) if context is not None else None
+    if inherited:
+        lines.append(f"\n{h_method} Унаследованные члены\n")
+        items = []
+        for entry in inherited:
+            base = f"[`{entry.base}`]({entry.url})" if entry.url else f"`{entry.base}`"
+            members = ", ".join(f"[`{name}`]({url})" if url else f"`{name}`" for name, url in entry.members)
+            items.append(f"- Унаследовано от {base}: {members}")
+        lines.append(pagefind_ignore("\n".join(items)))
 
     return "\n".join(lines)
 
 
-def generate_method_mdx(method: dict, badge: str = None) -> str:
+def generate_overloads_mdx(name: str, overloads: list[str]) -> str:
+    """Генерирует MDX со списком сигнатур перегрузок @overload."""
+    signatures = "\n".join(f"{name}{signature}" for signature in overloads)
+    return f"**Перегрузки**\n\n```python\n{signatures}\n```\n"
+
+
+def generate_method_mdx(method: ApiMethod, badge: str = None, anchor: str = None,
+                        context: Optional[RenderContext] = None) -> str:
     """Генерирует MDX для метода с улучшенным форматированием."""
     lines = []
+    symbols = context.symbols if context is not None else None
 
     # Заголовок с badge
-    badge_html = f" <small className=\"px-2 py-0.5 rounded bg-blue-100 dark:bg-blue-900 text-blue-800 dark:text-blue-200 text-xs\">{badge}</small>" if badge else ""
+    badge_html = f" <small {PAGEFIND_IGNORE} className=\"px-2 py-0.5 rounded bg-blue-100 dark:bg-blue-900 text-blue-800 dark:text-blue-200 text-xs\">{badge}</small>" if badge else ""
+    id_attr = f"id=\"{anchor}\" " if anchor else ""
 
-    lines.append(f"<div className=\"border-l-4 border-blue-500 pl-4 my-6\">")
-    lines.append(f"\n**`{method['name']}`**{badge_html}\n")
+    lines.append(f"<div {id_attr}className=\"border-l-4 border-blue-500 pl-4 my-6\">")
+    lines.append(f"\n**`{method.name}`**{badge_html}\n")
 
     # Сигнатура в блоке кода
-    sig = method['signature']
-    lines.append(f"```python\n{method['name']}{sig}\n```\n")
+    lines.append(f"```python\n{method.name}{method.signature}\n```\n")
+    if method.overloads:
+        lines.append(generate_overloads_mdx(method.name, method.overloads))
+    if symbols is not None:
+        links = symbols.signature_links(" ".join([method.signature, *method.overloads]))
+        if links:
+            lines.append(links)
 
-    if method["docstring"]:
-        lines.append(format_docstring(method["docstring"]))
+    if method.docstring:
+        lines.append(format_docstring(method.docstring, context))
 
     lines.append("</div>\n")
 
     return "\n".join(lines)
 
 
-def generate_function_mdx(func_info: dict) -> str:
-    """Генерирует MDX для функции."""
-    lines = [f"### `{func_info['name']}{func_info['signature']}`"]
+def generate_function_mdx(func_info: ApiFunction, heading_level: int = 3,
+                          context: Optional[RenderContext] = None) -> str:
+    """Генерирует MDX для функции; перегрузки @overload выводятся одним блоком."""
+    h = "#" * heading_level
+    symbols = context.symbols if context is not None else None
+    lines = [f"{h} `{func_info.name}{func_info.signature}`"]
+
+    if func_info.overloads:
+        lines.append("\n" + generate_overloads_mdx(func_info.name, func_info.overloads).rstrip("\n"))
+    if symbols is not None:
+        links = symbols.signature_links(" ".join([func_info.signature, *func_info.overloads]))
+        if links:
+            lines.append("\n" + links.rstrip("\n"))
 
-    if func_info["docstring"]:
-        lines.append(f"\n{format_docstring(func_info['docstring'])}")
+    if func_info.docstring:
+        lines.append(f"\n{format_docstring(func_info.docstring, context)}")
 
     return "\n".join(lines)
 
@@ -371,124 +1346,651 @@ MODULE_DESCRIPTIONS = {
     "phase_retrieval_problem": "Алгоритмы восстановления фазы",
     "visualization": "Инструменты визуализации",
     "detector": "Детекторы излучения",
+    "transforms": "Преобразования изображений во входные волновые фронты",
+    "units": "Единицы измерения с приставками СИ",
 }
 
-# Какие классы/функции экспортировать из корневых файлов
-CORE_EXPORTS = {
-    "wavefront.py": ["Wavefront", "mul"],
-    "simulation_parameters.py": ["SimulationParameters", "Axes"],
-    "parameters.py": ["Parameter", "ConstrainedParameter"],
-    "setup.py": ["LinearOpticalSetup"],
-    "clerk.py": ["Clerk"],
-    "detector.py": ["Detector", "IntensityDetector", "AmplitudeDetector"],
-}
-
-
-def generate_core_page(svetlanna_pkg: Path) -> tuple[str, dict]:
-    """Генерирует страницу Core с основными классами."""
-    all_classes = []
-    all_functions = []
-
-    for filename, exports in CORE_EXPORTS.items():
-        filepath = svetlanna_pkg / filename
-        if filepath.exists():
-            module_info = parse_module(filepath)
+# Порядок подпакетов верхнего уровня; остальные найденные идут за ними по алфавиту
+SUBMODULES = [
+    "elements",
+    "networks",
+    "specs",
+    "phase_retrieval_problem",
+    "visualization",
+]
+
+# Подпакеты, для которых страницы не генерируются (шаблоны fnmatch по имени
+# относительно svetlanna). Каталоги на "_" Next.js всё равно не публикует.
+DEFAULT_EXCLUDE = ["tests", "*.tests", "_*", "*._*"]
+
+# Адрес раздела API на сайте
+API_URL = "/docs/api"
+
+# Страница с функциями модуля в режиме --split-pages
+FUNCTIONS_PAGE = "functions"
+
+# Шаблонные части страниц (бейджи, примеры импорта, оглавления), которые
+# pagefind не индексирует
+PAGEFIND_IGNORE = 'data-pagefind-ignore="all"'
+
+CORE_IMPORT = "```python\nfrom svetlanna import Wavefront, SimulationParameters, Parameter\n```"
+
+# Страницы старых версий в поиск не попадают (frontmatter Nextra)
+UNSEARCHABLE_FRONTMATTER = "---\nsearchable: false\n---\n"
+
+
+def pagefind_ignore(content: str) -> str:
+    """Оборачивает блок Markdown в элемент, пропускаемый pagefind."""
+    return f"<div {PAGEFIND_IGNORE}>\n\n{content}\n\n</div>"
+
+
+def pagefind_tags(kind: str, module: Optional[str] = None,
+                  symbols: Iterable[tuple[str, str]] = ()) -> str:
+    """Разметка pagefind страницы API: метаданные и фильтры.
+
+    kind — вид страницы ("module", "class", "function", "overview"),
+    symbols — пары (вид, имя) описанных на странице символов. По фильтрам
+    module, kind и symbol поиск можно ограничить одним модулем или символом.
+    """
+    symbols = list(symbols)
+    meta = {"kind": kind}
+    filters = {"kind": [kind]}
+    if module is not None:
+        meta["module"] = module
+        filters["module"] = [module]
+    filters["symbol"] = []
+    for symbol_kind, name in symbols:
+        if symbol_kind not in filters["kind"]:
+            filters["kind"].append(symbol_kind)
+        filters["symbol"].append(name)
+    if kind == "class" and symbols:
+        meta["symbol"] = symbols[0][1]
+
+    lines = ["", "<div>"]
+    lines += [f'  <span data-pagefind-meta="{key}:{value}" />' for key, value in meta.items()]
+    lines += [f'  <span data-pagefind-filter="{key}:{value}" />'
+              for key, values in filters.items() for value in values]
+    lines.append("</div>")
+    return "\n".join(lines)
 
-            # Filter to only exported items
-            for cls in module_info["classes"]:
-                if cls["name"] in exports:
-                    all_classes.append(cls)
 
-            for func in module_info["functions"]:
-                if func["name"] in exports:
-                    all_functions.append(func)
+def module_symbols(module_info: "ApiModule") -> list[tuple[str, str]]:
+    """Классы и публичные функции модуля для фильтров pagefind."""
+    return ([("class", class_info.name) for class_info in module_info.classes]
+            + [("function", func_info.name) for func_info in module_info.public_functions])
+
+
+def unsearchable(render: Callable[[], Iterable[str]]) -> Iterator[str]:
+    """Строки страницы render с frontmatter, исключающим её из поиска."""
+    yield UNSEARCHABLE_FRONTMATTER
+    yield from render()
+
+
+class ExportResolver:
+    """Статически определяет публичные имена модулей пакета.
+
+    Следует относительным импортам в __init__.py и __all__, не импортируя
+    сам пакет (импорт svetlanna тянет за собой torch). Импорты файлов
+    берутся из parse_source, поэтому граф импортов кэшируется вместе
+    с результатами парсинга.
+    """
+
+    def __init__(self, package_dir: Path, parsed: dict[Path, dict],
+                 parse: Callable[[Path], dict] = parse_module, files: Optional[set] = None):
+        self.package_dir = package_dir
+        self.parsed = parsed
+        self.parse = parse
+        # Файлы пакета, если он читается не с диска (версии из git)
+        self.files = files
+        self.namespaces: dict[Path, dict] = {}
+        # Файлы, от которых зависят имена модуля (для --watch)
+        self.dependencies: dict[Path, set[Path]] = {}
+        self.resolving: set[Path] = set()
+
+    def load(self, path: Path) -> dict:
+        """Результат парсинга файла; файлы вне parsed парсятся по требованию."""
+        if path not in self.parsed:
+            self.parsed[path] = self.parse(path)
+        return self.parsed[path]
+
+    def exists(self, path: Path) -> bool:
+        return path in self.files if self.files is not None else path.exists()
+
+    def module_path(self, base: Path, dotted: str) -> Optional[Path]:
+        """Файл модуля или __init__.py пакета dotted относительно каталога base."""
+        target = base.joinpath(*dotted.split(".")) if dotted else base
+        if self.exists(target / "__init__.py"):
+            return target / "__init__.py"
+        if dotted and self.exists(target.with_suffix(".py")):
+            return target.with_suffix(".py")
+        return None
+
+    def namespace(self, path: Path) -> dict[str, Optional[tuple[Path, str]]]:
+        """Имена модуля: имя -> (файл, где оно определено, исходное имя).
+
+        Для подмодулей значение None. Имена, определённые присваиванием,
+        не отслеживаются — документируются только классы и функции.
+        """
+        if path in self.namespaces:
+            return self.namespaces[path]
+        if path in self.resolving:
+            # Циклический импорт: имена модуля ещё не известны
+            return {}
+        self.resolving.add(path)
+
+        module_info = self.load(path)
+        names: dict[str, Optional[tuple[Path, str]]] = {}
+        dependencies = {path}
+        for item in module_info["classes"] + module_info["functions"]:
+            names[item["name"]] = (path, item["name"])
+
+        for module, level, name, asname in module_info["imports"]:
+            base = path.parent
+            for _ in range(level - 1):
+                base = base.parent
+            if not base.is_relative_to(self.package_dir):
+                continue
 
-    lines = [
+            source = self.module_path(base, module)
+            if name == "*":
+                if source is not None:
+                    names.update(self.exports(source))
+                    dependencies |= self.file_dependencies(source)
+                continue
+            if self.module_path(base, f"{module}.{name}" if module else name) is not None:
+                names[asname] = None
+            elif source is not None and self.namespace(source).get(name) is not None:
+                names[asname] = self.namespace(source)[name]
+                dependencies |= self.file_dependencies(source)
+
+        self.resolving.discard(path)
+        self.namespaces[path] = names
+        self.dependencies[path] = dependencies
+        return names
+
+    def file_dependencies(self, path: Path) -> set[Path]:
+        """Файлы, изменение которых может изменить имена модуля path."""
+        self.namespace(path)
+        # При циклическом импорте зависимости модуля ещё не посчитаны
+        return self.dependencies.get(path, {path})
+
+    def exports(self, path: Path) -> dict[str, tuple[Path, str]]:
+        """Публичные классы и функции модуля в порядке __all__.
+
+        Без __all__ публичными считаются имена без "_": для __init__.py —
+        все, включая реэкспортированные, для остальных файлов — только
+        определённые в самом файле.
+        """
+        names = self.namespace(path)
+        public = self.load(path)["all"]
+        if public is None:
+            public = [
+                name for name, definition in names.items()
+                if not name.startswith("_")
+                and definition is not None
+                and (path.name == "__init__.py" or definition[0] == path)
+            ]
+        return {name: names[name] for name in public if names.get(name) is not None}
+
+
+def collect_exports(resolver: ExportResolver, exports: dict[str, tuple[Path, str]]) -> dict:
+    """Собирает описания экспортируемых классов и функций по месту их определения."""
+    classes = []
+    functions = []
+    seen = set()
+    for path, name in exports.values():
+        if (path, name) in seen:
+            continue
+        seen.add((path, name))
+
+        # При повторных определениях (например, @overload) действует последнее
+        module_info = resolver.load(path)
+        for cls in reversed(module_info["classes"]):
+            if cls["name"] == name:
+                classes.append(cls)
+                break
+        else:
+            for func in reversed(module_info["functions"]):
+                if func["name"] == name:
+                    functions.append(func)
+                    break
+
+    return {"classes": classes, "functions": functions}
+
+
+def collect_core_info(resolver: ExportResolver) -> dict:
+    """Собирает классы и функции, которые корневой пакет экспортирует из своих файлов."""
+    exports = resolver.exports(resolver.package_dir / "__init__.py")
+    return collect_exports(resolver, {
+        name: definition for name, definition in exports.items()
+        if definition[0].parent == resolver.package_dir
+    })
+
+
+def generate_core_page(module_info: ApiModule, context: Optional[RenderContext] = None) -> Iterator[str]:
+    """Генерирует строки страницы Core с основными классами."""
+    yield from [
         "# Core",
+        pagefind_tags("module", "core", module_symbols(module_info)),
         "",
         MODULE_DESCRIPTIONS["core"],
         "",
-        "```python",
-        "from svetlanna import Wavefront, SimulationParameters, Parameter",
-        "```",
+        pagefind_ignore(CORE_IMPORT),
     ]
 
-    if all_classes:
-        lines.append("\n## Классы\n")
-        for cls in all_classes:
-            lines.append(generate_class_mdx(cls))
-            lines.append("")
+    if module_info.classes:
+        yield "\n## Классы\n"
+        for cls in module_info.classes:
+            yield generate_class_mdx(cls, context=context)
+            yield ""
+
+    if module_info.functions:
+        yield "\n## Функции\n"
+        for func in module_info.public_functions:
+            yield generate_function_mdx(func, context=context)
+            yield ""
+
+
+def walk_package(svetlanna_pkg: Path, exclude: Iterable[str] = ()) -> list[Path]:
+    """Все .py файлы пакета и его подпакетов за один проход os.scandir.
+
+    Каждый каталог читается ровно один раз. В каталоги без __init__.py
+    и в подпакеты, подходящие под шаблоны exclude, обход не заходит.
+    """
+    exclude = list(exclude)
+    files = []
+    stack = [(svetlanna_pkg, "")]
+    while stack:
+        directory, name = stack.pop()
+        py_files = []
+        subdirs = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name.isidentifier():
+                        subdirs.append(entry.name)
+                elif entry.name.endswith(".py") and entry.is_file():
+                    py_files.append(Path(entry.path))
+        if name and directory / "__init__.py" not in py_files:
+            continue
+        files += py_files
+        for subdir in subdirs:
+            dotted = f"{name}.{subdir}" if name else subdir
+            if not any(fnmatch.fnmatchcase(dotted, pattern) for pattern in exclude):
+                stack.append((directory / subdir, dotted))
+    return files
+
+
+def package_file_groups(svetlanna_pkg: Path, files: Iterable[Path], include: Iterable[str] = (),
+                        exclude: Iterable[str] = ()) -> dict[str, list[Path]]:
+    """Группирует файлы пакета по модулям документации: {имя модуля: файлы}.
+
+    "core" — корень пакета (публичные модули корня из него выделяет
+    root_module_groups), остальные — подпакеты с __init__.py, в том числе
+    вложенные ("elements.lenses"). Подпакет исключается, если он сам или
+    его родитель подходит под exclude; при заданном include остаются только
+    подходящие под него. В каждой группе сначала __init__.py, затем
+    остальные файлы по имени; модули идут в порядке дерева, верхний
+    уровень — в порядке SUBMODULES.
+    """
+    include = list(include)
+    exclude = list(exclude)
+    by_dir: dict[Path, list[Path]] = {}
+    for path in files:
+        by_dir.setdefault(path.parent, []).append(path)
+    packages = {directory for directory, dir_files in by_dir.items()
+                if any(path.name == "__init__.py" for path in dir_files)}
+
+    groups = {}
+    for directory, dir_files in by_dir.items():
+        if directory == svetlanna_pkg:
+            name = "core"
+        else:
+            if not directory.is_relative_to(svetlanna_pkg):
+                continue
+            parts = directory.relative_to(svetlanna_pkg).parts
+            # Все каталоги до корня должны быть пакетами и не исключены
+            prefixes = [".".join(parts[:i + 1]) for i in range(len(parts))]
+            if any(svetlanna_pkg.joinpath(*parts[:i + 1]) not in packages for i in range(len(parts))):
+                continue
+            if any(fnmatch.fnmatchcase(prefix, pattern) for prefix in prefixes for pattern in exclude):
+                continue
+            name = prefixes[-1]
+            if include and not any(fnmatch.fnmatchcase(name, pattern) for pattern in include):
+                continue
+        groups[name] = sorted(dir_files, key=lambda path: (path.name != "__init__.py", path.name))
+
+    return {name: groups[name] for name in sorted(groups, key=module_order)}
+
+
+def module_order(name: str) -> tuple:
+    """Ключ сортировки модулей: core, затем SUBMODULES, затем остальные по алфавиту."""
+    parts = name.split(".")
+    top = SUBMODULES.index(parts[0]) if parts[0] in SUBMODULES else len(SUBMODULES)
+    return name != "core", [(top, parts[0]), *((0, part) for part in parts[1:])]
+
+
+def root_module_groups(resolver: ExportResolver, file_groups: dict[str, list[Path]],
+                       include: Iterable[str] = (), exclude: Iterable[str] = ()) -> dict[str, list[Path]]:
+    """Выделяет из core публичные модули корня пакета (svetlanna.detector и т.п.).
+
+    Файл корня, ни одно определение которого корневой пакет не
+    реэкспортирует, документируется отдельным модулем с именем файла:
+    его объекты импортируются из svetlanna.<файл>, а не из svetlanna.
+    Файлы без публичных определений остаются в core.
+    """
+    include = list(include)
+    exclude = list(exclude)
+    core_files = {
+        definition[0] for definition in resolver.exports(resolver.package_dir / "__init__.py").values()
+    }
+    groups = dict(file_groups)
+    core = []
+    for path in groups.get("core", []):
+        name = path.stem
+        if (path.name == "__init__.py" or path in core_files or name in groups
+                or any(fnmatch.fnmatchcase(name, pattern) for pattern in exclude)
+                or (include and not any(fnmatch.fnmatchcase(name, pattern) for pattern in include))
+                or not resolver.exports(path)):
+            core.append(path)
+        else:
+            groups[name] = [path]
+    if "core" in groups:
+        groups["core"] = core
+    return {name: groups[name] for name in sorted(groups, key=module_order)}
+
+
+def collect_modules(resolver: ExportResolver, file_groups: dict[str, list[Path]],
+                    cache: ParseCache, timings: "Timings", label: str = "") -> list[ApiModule]:
+    """Собирает модель API: core и непустые подпакеты.
+
+    Пустой подпакет остаётся, если у него есть непустые вложенные подпакеты:
+    его страница служит разделом для них. label — префикс имён модулей
+    в timings (версия документации).
+    """
+    modules = []
+    for name, files in file_groups.items():
+        with timings.stage("exports"):
+            if name == "core":
+                # Core page (main classes from root files) goes first
+                info = collect_core_info(resolver)
+            else:
+                subpackages = [files[0].parent.joinpath(*other.split(".")[name.count(".") + 1:])
+                               for other in file_groups if other.startswith(f"{name}.")]
+                info = collect_submodule_info(resolver, files, subpackages)
+            info["internal_classes"] = collect_internal_classes(resolver, files, info["classes"])
+        modules.append(ApiModule.from_info(name, info))
+
+    # Skip empty modules (children come after parents, so walk backwards)
+    kept = []
+    for module_info in reversed(modules):
+        if (module_info.name != "core" and not module_info.classes and not module_info.functions
+                and not any(other.name.startswith(f"{module_info.name}.") for other in kept)):
+            print(f"Skipping empty module: {label}{module_info.name}")
+            continue
+        kept.append(module_info)
+    kept.reverse()
+
+    for module_info in kept:
+        timings.add_module(f"{label}{module_info.name}", file_groups[module_info.name], module_info, cache)
+    return kept
+
+
+def collect_internal_classes(resolver: ExportResolver, files: list[Path], classes: list[dict]) -> list[dict]:
+    """Классы файлов модуля, которых нет среди документируемых classes."""
+    names = {cls["name"] for cls in classes}
+    internal = []
+    for path in files:
+        for cls in resolver.load(path)["classes"]:
+            if cls["name"] not in names:
+                names.add(cls["name"])
+                internal.append(cls)
+    return internal
+
+
+def collect_submodule_info(resolver: ExportResolver, files: list[Path],
+                           subpackages: Iterable[Path] = ()) -> dict:
+    """Собирает публичные классы и функции подпакета по его __init__.py
+    (или модуля корня пакета по самому файлу).
+
+    Если __init__.py ничего не экспортирует, документируются публичные
+    определения всех файлов подпакета. Объекты из subpackages (каталогов
+    вложенных подпакетов со своими страницами) документируются там.
+    """
+    exports = resolver.exports(files[0])
+    if not exports:
+        for path in files[1:]:
+            exports.update(resolver.exports(path))
+    subpackages = list(subpackages)
+    exports = {
+        name: definition for name, definition in exports.items()
+        if not any(definition[0].is_relative_to(subpackage) for subpackage in subpackages)
+    }
+
+    module_info = collect_exports(resolver, exports)
+    module_info["docstring"] = resolver.load(files[0])["docstring"]
+    return module_info
+
+
+def render_page(module_info: ApiModule, context: Optional[RenderContext] = None) -> Iterator[str]:
+    """Генерирует строки MDX страницы модуля."""
+    if module_info.name == "core":
+        return generate_core_page(module_info, context)
+    return generate_module_mdx(module_info, submodule=True, context=context)
+
+
+def render_class_page(module_name: str, class_info: ApiClass,
+                      context: Optional[RenderContext] = None) -> Iterator[str]:
+    """Генерирует строки отдельной страницы класса (режим --split-pages).
+
+    Передаётся только имя модуля, а не сам модуль: render уходит в процесс
+    пула для каждой страницы класса.
+    """
+    heading, _, body = generate_class_mdx(class_info, heading_level=1, context=context).partition("\n")
+    yield heading
+    yield pagefind_tags("class", module_name, [("class", class_info.name)])
+    yield ""
+    yield body.lstrip("\n")
+
+
+def generate_functions_page(module_info: ApiModule, context: Optional[RenderContext] = None) -> Iterator[str]:
+    """Генерирует строки страницы с функциями модуля (режим --split-pages)."""
+    yield f"# {module_info.title}: функции"
+    yield pagefind_tags("function", module_info.name,
+                        [("function", func_info.name) for func_info in module_info.public_functions])
+    yield ""
+    for func_info in module_info.public_functions:
+        yield generate_function_mdx(func_info, heading_level=2, context=context)
+        yield ""
+
+
+def api_url(version: Optional[str] = None) -> str:
+    """Адрес раздела API: основного или версии version."""
+    return f"{API_URL}/{version}" if version else API_URL
 
-    if all_functions:
-        lines.append("\n## Функции\n")
-        for func in all_functions:
-            if not func["name"].startswith("_"):
-                lines.append(generate_function_mdx(func))
-                lines.append("")
 
-    module_info = {"classes": all_classes, "functions": all_functions}
-    return "\n".join(lines), module_info
+def version_slug(ref: str) -> str:
+    """Имя каталога версии: последний компонент ref без недопустимых символов.
 
+    Next.js не создаёт маршруты для каталогов, начинающихся с "_".
+    """
+    return re.sub(r"[^\w.-]", "-", ref.rsplit("/", 1)[-1]).lstrip("_.")
 
-def generate_module_mdx(module_name: str, module_info: dict, submodule: bool = False) -> str:
-    """Генерирует MDX для модуля."""
-    title = module_name.replace("_", " ").title()
-    lines = [f"# {title}"]
 
-    desc = MODULE_DESCRIPTIONS.get(module_name, "")
+def generate_module_index(module_info: ApiModule, version: Optional[str] = None,
+                          context: Optional[RenderContext] = None) -> Iterator[str]:
+    """Генерирует строки страницы-оглавления модуля (режим --split-pages)."""
+    base_url = f"{api_url(version)}/{module_info.path}"
+    yield f"# {module_info.title}"
+    # Tables only repeat the class and function pages, which carry the symbol filters
+    yield pagefind_tags("module", module_info.name)
+
+    desc = MODULE_DESCRIPTIONS.get(module_info.name, "")
     if desc:
-        lines.append(f"\n{desc}")
+        yield f"\n{desc}"
 
-    if module_info["docstring"]:
-        lines.append(f"\n{format_docstring(module_info['docstring'])}")
+    if module_info.docstring:
+        yield f"\n{format_docstring(module_info.docstring, context)}"
 
     # Import example
-    if submodule:
-        lines.append(f"\n```python\nfrom svetlanna.{module_name} import ...\n```")
+    if module_info.name == "core":
+        yield "\n" + pagefind_ignore(CORE_IMPORT)
     else:
-        lines.append(f"\n```python\nimport svetlanna\n```")
+        yield "\n" + pagefind_ignore(f"```python\nfrom {module_info.package} import ...\n```")
+
+    if module_info.classes:
+        yield "\n## Классы\n"
+        rows = [
+            "| Класс | Описание | Свойства | Методы |",
+            "|:------|:---------|:--------:|:------:|",
+        ]
+        for class_info in module_info.classes:
+            summary = escape_mdx(docstring_summary(class_info.docstring)).replace("|", "\\|")
+            rows.append(f"| [`{class_info.name}`]({base_url}/{class_page_slug(class_info.name)}) "
+                        f"| {summary} | {len(class_info.properties)} | {class_info.method_count} |")
+        yield pagefind_ignore("\n".join(rows))
+
+    if module_info.public_functions:
+        yield "\n## Функции\n"
+        anchor = heading_anchors()
+        items = []
+        for func_info in module_info.public_functions:
+            link = f"{base_url}/{FUNCTIONS_PAGE}#{anchor(func_info.name + func_info.signature)}"
+            summary = escape_mdx(docstring_summary(func_info.docstring))
+            items.append(f"- [`{func_info.name}`]({link})" + (f" — {summary}" if summary else ""))
+        yield pagefind_ignore("\n".join(items))
+    yield ""
+
+
+def class_page_slug(class_name: str) -> str:
+    """Имя каталога страницы класса; без "_" в начале — такие каталоги Next.js не публикует."""
+    return slugify(class_name).lstrip("_")
+
+
+def module_titles(modules: list[ApiModule], parent: Optional[str] = None) -> dict[str, str]:
+    """Заголовки для _meta.js: модули верхнего уровня или прямые потомки parent."""
+    prefix = f"{parent}." if parent else ""
+    return {
+        module.name[len(prefix):]: module.title for module in modules
+        if module.name.startswith(prefix) and "." not in module.name[len(prefix):]
+    }
 
-    # Classes
-    if module_info["classes"]:
-        lines.append("\n## Классы\n")
-        for class_info in module_info["classes"]:
-            lines.append(generate_class_mdx(class_info))
-            lines.append("")
 
-    # Functions
-    public_functions = [f for f in module_info["functions"] if not f["name"].startswith("_")]
-    if public_functions:
-        lines.append("\n## Функции\n")
-        for func_info in public_functions:
-            lines.append(generate_function_mdx(func_info))
-            lines.append("")
+def generate_meta_js(entries: dict[str, str]) -> str:
+    """Генерирует _meta.js с порядком и заголовками страниц."""
+    meta_content = "export default {\n"
+    for key, value in entries.items():
+        meta_content += f'  "{key}": "{value}",\n'
+    meta_content += "};\n"
+    return meta_content
 
-    return "\n".join(lines)
 
+def module_pages(module_info: ApiModule, split_pages: bool = False, version: Optional[str] = None,
+                 context: Optional[RenderContext] = None) -> tuple[list, dict[str, str]]:
+    """Возвращает страницы модуля [(путь, render)] и записи его _meta.js.
+
+    По умолчанию модуль — одна страница. В режиме split_pages каждый класс
+    и группа функций получают свою страницу, а page.mdx модуля становится
+    оглавлением со ссылками. Страницы версии version лежат в её каталоге,
+    context — таблица символов той же версии и готовые формулы.
+    """
+    module_dir = f"{version}/{module_info.path}" if version else module_info.path
+    if not split_pages:
+        pages = [(f"{module_dir}/page.mdx", partial(render_page, module_info, context))]
+        return version_pages(pages, version), {}
+
+    pages = [(f"{module_dir}/page.mdx", partial(generate_module_index, module_info, version, context))]
+    meta_entries = {}
+    for class_info in module_info.classes:
+        slug = class_page_slug(class_info.name)
+        pages.append((f"{module_dir}/{slug}/page.mdx",
+                      partial(render_class_page, module_info.name, class_info, context)))
+        meta_entries[slug] = class_info.name
+
+    if module_info.public_functions:
+        pages.append((f"{module_dir}/{FUNCTIONS_PAGE}/page.mdx",
+                      partial(generate_functions_page, module_info, context)))
+        meta_entries[FUNCTIONS_PAGE] = "Функции"
+
+    return version_pages(pages, version), meta_entries
+
+
+def version_pages(pages: list, version: Optional[str]) -> list:
+    """Исключает страницы версии version из поиска: иначе каждый символ нашёлся бы в каждой версии."""
+    if version is None:
+        return pages
+    return [(rel_path, partial(unsearchable, render)) for rel_path, render in pages]
+
+
+def generate_module_mdx(module_info: ApiModule, submodule: bool = False,
+                        context: Optional[RenderContext] = None) -> Iterator[str]:
+    """Генерирует строки MDX для модуля.
+
+    Страница отдаётся по частям (не крупнее одного класса), чтобы её можно
+    было записывать в файл потоком; части соединяются через "\\n".
+    """
+    yield f"# {module_info.title}"
+    yield pagefind_tags("module", module_info.name, module_symbols(module_info))
+
+    desc = MODULE_DESCRIPTIONS.get(module_info.name, "")
+    if desc:
+        yield f"\n{desc}"
+
+    if module_info.docstring:
+        yield f"\n{format_docstring(module_info.docstring, context)}"
+
+    # Import example
+    if submodule:
+        yield "\n" + pagefind_ignore(f"```python\nfrom {module_info.package} import ...\n```")
+    else:
+        yield "\n" + pagefind_ignore("```python\nimport svetlanna\n```")
 
-def generate_api_overview(submodules: list) -> str:
-    """Генерирует MDX для главной страницы API."""
-    lines = [
-        "# API Reference",
+    # Classes
+    if module_info.classes:
+        yield "\n## Классы\n"
+        for class_info in module_info.classes:
+            yield generate_class_mdx(class_info, context=context)
+            yield ""
+
+    # Functions
+    if module_info.public_functions:
+        yield "\n## Функции\n"
+        for func_info in module_info.public_functions:
+            yield generate_function_mdx(func_info, context=context)
+            yield ""
+
+
+def generate_api_overview(submodules: list[ApiModule], version: Optional[str] = None,
+                          versions: Iterable[str] = ()) -> str:
+    """Генерирует MDX для главной страницы API (или страницы версии version).
+
+    versions — каталоги версий, ссылки на которые выводятся в конце.
+    """
+    base_url = api_url(version)
+    lines = [UNSEARCHABLE_FRONTMATTER] if version else []
+    lines += [
+        f"# API Reference ({version})" if version else "# API Reference",
+        pagefind_tags("overview"),
         "",
-        "Документация по API библиотеки SVETlANNa.",
+        f"Документация по API библиотеки SVETlANNa версии {version}." if version
+        else "Документация по API библиотеки SVETlANNa.",
         "",
-        "```python",
-        "import svetlanna",
-        "from svetlanna import Wavefront, SimulationParameters",
-        "```",
+        pagefind_ignore("```python\nimport svetlanna\nfrom svetlanna import Wavefront, SimulationParameters\n```"),
         "",
         "## Модули",
         "",
+        f"<div {PAGEFIND_IGNORE}>",
+        "",
     ]
 
-    for submodule, module_info in submodules:
-        title = submodule.replace("_", " ").title()
-        desc = MODULE_DESCRIPTIONS.get(submodule, "")
-        class_count = len(module_info["classes"])
-        func_count = len([f for f in module_info["functions"] if not f["name"].startswith("_")])
+    for module_info in submodules:
+        desc = MODULE_DESCRIPTIONS.get(module_info.name, "")
+        class_count = len(module_info.classes)
+        func_count = len(module_info.public_functions)
 
-        line = f"- **[{title}](/docs/api/{submodule})**"
+        # Nested subpackages are listed under their parents
+        indent = "  " * module_info.name.count(".")
+        line = f"{indent}- **[{module_info.title}]({base_url}/{module_info.path})**"
         if desc:
             line += f" — {desc}"
         if class_count or func_count:
@@ -500,108 +2002,1226 @@ def generate_api_overview(submodules: list) -> str:
             line += f" ({', '.join(parts)})"
 
         lines.append(line)
+    lines += ["", "</div>"]
+
+    versions = list(versions)
+    if versions:
+        lines += ["", "## Версии", ""]
+        lines.append(pagefind_ignore("\n".join(f"- [{slug}]({api_url(slug)})" for slug in versions)))
 
     return "\n".join(lines) + "\n"
 
 
-def main():
-    # Paths
-    script_dir = Path(__file__).parent
-    project_root = script_dir.parent
-    temp_dir = project_root / ".temp"
-    svetlanna_dir = temp_dir / "SVETlANNa"
-    output_dir = project_root / "app" / "docs" / "api"
+def slugify(text: str) -> str:
+    """Формирует якорь заголовка так же, как github-slugger в Nextra."""
+    return re.sub(r"[^\w\- ]", "", text.lower()).replace(" ", "-")
 
-    # Clone/update SVETlANNa
-    temp_dir.mkdir(exist_ok=True)
-    clone_or_update_repo(
-        "https://github.com/CompPhysLab/SVETlANNa.git",
-        svetlanna_dir
-    )
 
-    # Clean output directory
-    if output_dir.exists():
-        shutil.rmtree(output_dir)
-    output_dir.mkdir(parents=True)
+def docstring_summary(docstring: Optional[str]) -> str:
+    """Возвращает первую строку docstring."""
+    if not docstring:
+        return ""
+    return docstring.strip().split("\n", 1)[0].strip()
+
+
+def heading_anchors() -> Callable[[str], str]:
+    """Возвращает функцию, выдающую якоря заголовков одной страницы.
+
+    Повторяющиеся заголовки github-slugger нумерует суффиксом -N.
+    """
+    seen_slugs: dict[str, int] = {}
+
+    def anchor(heading: str) -> str:
+        slug = slugify(heading)
+        count = seen_slugs.get(slug, 0)
+        seen_slugs[slug] = count + 1
+        return f"{slug}-{count}" if count else slug
+
+    return anchor
+
+
+def iter_symbols(modules: list[ApiModule], split_pages: bool = False,
+                 version: Optional[str] = None) -> Iterator[tuple[str, str, object, str]]:
+    """Символы API: (полное имя, вид, объект модели, адрес на сайте).
+
+    Адреса указывают на якоря, которые генерируют generate_class_mdx
+    и generate_function_mdx, в каталоге версии version.
+    """
+    for module_info in modules:
+        package = module_info.package
+        base_url = f"{api_url(version)}/{module_info.path}"
+        anchor = heading_anchors()
+
+        for class_info in module_info.classes:
+            class_name = class_info.name
+            if split_pages:
+                page = f"{base_url}/{class_page_slug(class_name)}"
+                class_url = page
+            else:
+                page = base_url
+                class_url = f"{page}#{anchor(class_name)}"
+            yield f"{package}.{class_name}", "class", class_info, class_url
+
+            members = [(m, "property") for m in class_info.properties]
+            members += [(m, "classmethod") for m in class_info.classmethods]
+            members += [(m, "method") for m in class_info.public_methods if m is not class_info.init]
+            for method, kind in members:
+                yield f"{package}.{class_name}.{method.name}", kind, method, f"{page}#{class_name}.{method.name}"
+
+        page = f"{base_url}/{FUNCTIONS_PAGE}" if split_pages else base_url
+        for func_info in module_info.public_functions:
+            yield (f"{package}.{func_info.name}", "function", func_info,
+                   f"{page}#{anchor(func_info.name + func_info.signature)}")
+
+
+def build_symbol_index(modules: list[ApiModule], split_pages: bool = False) -> dict:
+    """Строит компактный индекс символов API для перехода к определениям.
+
+    Каждая запись — массив значений в порядке "fields".
+    """
+    symbols = []
+    for name, kind, item, url in iter_symbols(modules, split_pages):
+        if kind == "class":
+            init = item.init
+            signature = init.signature.replace("(self, ", "(", 1).replace("(self)", "()", 1) if init else ""
+        elif kind == "property":
+            signature = ""
+        else:
+            signature = item.signature
+        symbols.append([name, kind, signature, docstring_summary(item.docstring), url])
+
+    return {
+        "version": 1,
+        "fields": ["name", "kind", "signature", "summary", "url"],
+        "symbols": symbols,
+    }
 
-    # Parse main module
-    svetlanna_pkg = svetlanna_dir / "svetlanna"
 
-    # Generate _meta.js (without "index" - page.mdx serves as index in App Router)
-    meta_entries = {}
-    generated_submodules = []
-
-    # Generate Core page (main classes from root files)
-    core_content, core_info = generate_core_page(svetlanna_pkg)
-    core_output = output_dir / "core"
-    core_output.mkdir(exist_ok=True)
-    (core_output / "page.mdx").write_text(core_content, encoding="utf-8")
-    print(f"Generated: api/core/page.mdx")
-    meta_entries["core"] = "Core"
-    generated_submodules.append(("core", core_info))
-
-    # Submodules to parse
-    submodules = [
-        "elements",
-        "networks",
-        "specs",
-        "phase_retrieval_problem",
-        "visualization",
-    ]
+# Имя Python, возможно с точками: "Wavefront", "svetlanna.elements.Lens"
+IDENTIFIER_PATTERN = re.compile(r"[A-Za-z_]\w*(?:\.[A-Za-z_]\w*)*")
+
+
+class SymbolTable:
+    """Глобальная таблица символов API: имя -> адрес определения на сайте.
+
+    Строится один раз за запуск по всем модулям (для каждой версии своя)
+    и позволяет ставить ссылки на типы поиском по словарю. Кроме полных
+    имён в таблице есть короткие имена классов, если они однозначны.
+    key — хэш содержимого таблицы для кэша format_docstring: копия таблицы
+    в процессе пула даёт тот же ключ, а изменившийся API — другой.
+    """
+
+    def __init__(self, modules: list[ApiModule], split_pages: bool = False, version: Optional[str] = None):
+        self.urls: dict[str, str] = {}
+        classes: dict[str, set[str]] = {}
+        for name, kind, _, url in iter_symbols(modules, split_pages, version):
+            self.urls[name] = url
+            if kind == "class":
+                classes.setdefault(name.rsplit(".", 1)[-1], set()).add(url)
+        for name, urls in classes.items():
+            if len(urls) == 1:
+                self.urls[name] = urls.pop()
+        self.key = hashlib.sha1(json.dumps(self.urls, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def url(self, name: str) -> Optional[str]:
+        """Адрес символа; для "svetlanna.X" и "sv.X" подходит и короткое имя X."""
+        url = self.urls.get(name)
+        if url is None and name.startswith(("svetlanna.", "sv.")):
+            url = self.urls.get(name.rsplit(".", 1)[-1])
+        return url
+
+    def link_type(self, text: str) -> str:
+        """Выводит тип как код, заменяя известные имена ссылками на их определения."""
+        pieces = []
+        pos = 0
+        for match in IDENTIFIER_PATTERN.finditer(text):
+            url = self.url(match.group())
+            if url is None:
+                continue
+            if match.start() > pos:
+                pieces.append(f"`{text[pos:match.start()]}`")
+            pieces.append(f"[`{match.group()}`]({url})")
+            pos = match.end()
+        if not pieces:
+            return f"`{text}`"
+        if pos < len(text):
+            pieces.append(f"`{text[pos:]}`")
+        return "".join(pieces)
+
+    def signature_links(self, signature: str) -> str:
+        """Строка со ссылками на известные типы из сигнатуры или "", если их нет."""
+        links = {}
+        for match in IDENTIFIER_PATTERN.finditer(signature):
+            url = self.url(match.group())
+            if url is not None:
+                links.setdefault(match.group(), url)
+        if not links:
+            return ""
+        return f"<small {PAGEFIND_IGNORE}>Типы: " + ", ".join(f"[`{name}`]({url})" for name, url in links.items()) + "</small>\n"
+
+
+@dataclass(slots=True)
+class InheritedMembers:
+    """Открытые члены, унаследованные от одного базового класса; url — адреса на сайте."""
+    base: str
+    url: Optional[str]
+    members: list[tuple[str, Optional[str]]]
+
+
+class ClassHierarchy:
+    """Иерархия классов API по всем модулям одной версии.
+
+    Строится один раз за запуск рядом с SymbolTable. Базовые классы из
+    bases разрешаются в классы API так же, как типы в SymbolTable; внешние
+    (nn.Module, ABC) пропускаются. Неэкспортируемые классы пакета
+    (internal_classes модулей) участвуют в MRO, но ссылок на них нет.
+    Порядок MRO — линеаризация C3.
+    """
+
+    def __init__(self, modules: list[ApiModule], symbols: SymbolTable):
+        self.symbols = symbols
+        self.classes: dict[str, ApiClass] = {}
+        self.internal: set[str] = set()
+        names: dict[str, list[str]] = {}
+        internal_names: dict[str, list[str]] = {}
+        for module_info in modules:
+            for class_info in module_info.classes:
+                full_name = f"{module_info.package}.{class_info.name}"
+                self.classes[full_name] = class_info
+                names.setdefault(class_info.name, []).append(full_name)
+        for module_info in modules:
+            for class_info in module_info.internal_classes:
+                full_name = f"{module_info.package}.{class_info.name}"
+                if full_name not in self.classes:
+                    self.classes[full_name] = class_info
+                    self.internal.add(full_name)
+                    internal_names.setdefault(class_info.name, []).append(full_name)
+        # Короткие имена, однозначные во всём API; документированные классы важнее внутренних
+        for name, full_names in internal_names.items():
+            names.setdefault(name, full_names)
+        self.short_names = {name: full_names[0] for name, full_names in names.items() if len(full_names) == 1}
+        self.mros: dict[str, list[str]] = {}
+
+    def resolve(self, base: str, package: str) -> Optional[str]:
+        """Полное имя класса API для базового класса base из пакета package."""
+        base = base.split("[", 1)[0]
+        for name in (f"{package}.{base}", base, f"svetlanna.{base}"):
+            if name in self.classes:
+                return name
+        if "." not in base or base.startswith(("svetlanna.", "sv.")):
+            return self.short_names.get(base.rsplit(".", 1)[-1])
+        return None
+
+    def mro(self, name: str, visiting: frozenset = frozenset()) -> list[str]:
+        """Порядок MRO класса name среди классов API (включая сам класс)."""
+        if name in self.mros:
+            return self.mros[name]
+        if name in visiting:
+            return [name]
+        package = name.rsplit(".", 1)[0]
+        bases = []
+        for base in self.classes[name].bases:
+            resolved = self.resolve(base, package)
+            # "class Element(Element)" расширяет одноимённый внешний класс, а не себя
+            if resolved is not None and resolved != name and resolved not in bases:
+                bases.append(resolved)
+
+        sequences = [self.mro(base, visiting | {name}) for base in bases] + [bases]
+        result = [name]
+        while True:
+            sequences = [sequence for sequence in sequences if sequence]
+            if not sequences:
+                break
+            head = next((sequence[0] for sequence in sequences
+                         if not any(sequence[0] in other[1:] for other in sequences)), None)
+            if head is None:
+                # Inconsistent hierarchy: Python would reject it, fall back to depth-first order
+                head = sequences[0][0]
+            result.append(head)
+            sequences = [[item for item in sequence if item != head] for sequence in sequences]
+        self.mros[name] = result
+        return result
+
+    def inherited(self, module_info: ApiModule, class_info: ApiClass) -> list[InheritedMembers]:
+        """Открытые члены предков класса, не переопределённые ближе по MRO."""
+        defined = {method.name for method in class_info.methods}
+        result = []
+        for base_name in self.mro(f"{module_info.package}.{class_info.name}")[1:]:
+            base_info = self.classes[base_name]
+            linked = base_name not in self.internal
+            members = []
+            for method in [*base_info.properties, *base_info.classmethods, *base_info.public_methods]:
+                if method is base_info.init or method.name in defined:
+                    continue
+                members.append((method.name, self.symbols.url(f"{base_name}.{method.name}") if linked else None))
+            defined.update(method.name for method in base_info.methods)
+            if members:
+                result.append(InheritedMembers(base_info.name, self.symbols.url(base_name) if linked else None, members))
+        return result
+
+
+def update_file(path: Path, content: str) -> bool:
+    """Записывает файл вне каталога API, только если содержимое изменилось."""
+    data = content.encode("utf-8")
+    if path.exists() and path.read_bytes() == data:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return True
+
+
+def hash_lines(lines: Iterable[str]) -> str:
+    """Считает sha256 от "\\n".join(lines), не собирая текст в памяти."""
+    digest = hashlib.sha256()
+    separator = b""
+    for line in lines:
+        digest.update(separator)
+        digest.update(line.encode("utf-8"))
+        separator = b"\n"
+    return digest.hexdigest()
+
+
+def write_lines(lines: Iterable[str], path: Path) -> float:
+    """Потоково записывает "\\n".join(lines) в файл через временный файл.
+
+    Возвращает время самой записи, без времени получения строк из lines.
+    """
+    start = time.perf_counter()
+    rendering = 0.0
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8", newline="", buffering=1 << 16) as f:
+        separator = ""
+        written = time.perf_counter()
+        for line in lines:
+            rendering += time.perf_counter() - written
+            f.write(separator)
+            f.write(line)
+            separator = "\n"
+            written = time.perf_counter()
+    os.replace(tmp_path, path)
+    return time.perf_counter() - start - rendering
+
+
+def emit_page(render: Callable[[], Iterable[str]], path: Path,
+              current_digest: Optional[str]) -> tuple[str, bool, dict]:
+    """Записывает страницу, только если её содержимое изменилось.
+
+    Страница сначала рендерится в хэш и, если он отличается от текущего,
+    рендерится повторно прямо в файл. В памяти одновременно находится
+    не больше одного класса. Возвращает хэш, признак записи и время
+    стадий: render (с format_docstring внутри), format_docstring и write,
+    а также число вызовов format_docstring и попаданий в FORMAT_CACHE
+    (повторный рендер при записи попадает в кэш).
+    """
+    format_before = dict(FORMAT_STATS)
+    start = time.perf_counter()
+    digest = hash_lines(render())
+    stats = {
+        "render": time.perf_counter() - start,
+        "format_docstring": FORMAT_STATS["seconds"] - format_before["seconds"],
+        "write": 0.0,
+    }
+    written = digest != current_digest
+    if written:
+        stats["write"] = write_lines(render(), path)
+    stats["format_calls"] = FORMAT_STATS["calls"] - format_before["calls"]
+    stats["format_hits"] = FORMAT_STATS["hits"] - format_before["hits"]
+    return digest, written, stats
+
+
+class OutputWriter:
+    """Инкрементальная запись сгенерированных файлов.
+
+    Файл перезаписывается только если его содержимое изменилось, а при
+    завершении удаляются только файлы, которые больше не генерируются.
+    Хэши записанных файлов хранятся в манифесте, чтобы не перечитывать
+    неизменённые файлы с диска.
+    """
+
+    def __init__(self, output_dir: Path, manifest_path: Path):
+        self.output_dir = output_dir
+        self.manifest_path = manifest_path
+        self.manifest: dict[str, dict] = {}
+        self.produced: set[str] = set()
+        # Время стадий emit_page по страницам (для --timings)
+        self.page_stats: dict[str, dict] = {}
+        self.written = 0
+        self.unchanged = 0
+        self.removed = 0
+
+        if manifest_path.exists():
+            try:
+                self.manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                self.manifest = {}
+
+    def current_digest(self, rel_path: str) -> Optional[str]:
+        """Возвращает sha256 файла на диске или None, если файла нет."""
+        path = self.output_dir / rel_path
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+
+        # Размер и mtime совпадают с манифестом — доверяем сохранённому хэшу
+        entry = self.manifest.get(rel_path)
+        if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            return entry["sha256"]
+
+        with open(path, "rb") as f:
+            return hashlib.file_digest(f, "sha256").hexdigest()
+
+    def record(self, rel_path: str, digest: str, written: bool) -> None:
+        """Учитывает файл в манифесте после emit_page."""
+        self.produced.add(rel_path)
+        if written:
+            self.written += 1
+            print(f"Generated: api/{rel_path}")
+        else:
+            self.unchanged += 1
+
+        stat = (self.output_dir / rel_path).stat()
+        self.manifest[rel_path] = {
+            "sha256": digest,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+
+    def emit_many(self, pages: list[tuple[str, Callable[[], Iterable[str]]]],
+                  executor: Optional[Executor] = None) -> None:
+        """Записывает набор страниц, при наличии executor — параллельно."""
+        renders = [render for _, render in pages]
+        paths = [self.output_dir / rel_path for rel_path, _ in pages]
+        digests = [self.current_digest(rel_path) for rel_path, _ in pages]
+
+        run = executor.map if executor is not None else map
+        for (rel_path, _), (digest, written, stats) in zip(pages, run(emit_page, renders, paths, digests)):
+            self.record(rel_path, digest, written)
+            self.page_stats[rel_path] = stats
+
+    def keep(self, rel_paths: Iterable[str]) -> None:
+        """Отмечает файлы как сгенерированные без перерендеринга (режим --watch)."""
+        self.produced.update(rel_paths)
+
+    def reset(self) -> None:
+        """Начинает новый проход записи (режим --watch)."""
+        self.produced = set()
+        self.page_stats = {}
+        self.written = 0
+        self.unchanged = 0
+        self.removed = 0
+
+    def write(self, rel_path: str, content: str) -> None:
+        """Записывает небольшой файл, если его содержимое изменилось."""
+        self.emit_many([(rel_path, lambda: [content])])
+
+    def finalize(self) -> None:
+        """Удаляет устаревшие файлы и пустые каталоги, сохраняет манифест."""
+        if self.output_dir.exists():
+            for path in sorted(self.output_dir.rglob("*"), reverse=True):
+                rel_path = path.relative_to(self.output_dir).as_posix()
+                if path.is_file() and rel_path not in self.produced:
+                    path.unlink()
+                    self.removed += 1
+                    print(f"Removed: api/{rel_path}")
+                elif path.is_dir() and not any(path.iterdir()):
+                    path.rmdir()
+
+        self.manifest = {k: v for k, v in self.manifest.items() if k in self.produced}
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        self.manifest_path.write_text(json.dumps(self.manifest, indent=1, sort_keys=True), encoding="utf-8")
+
+
+def render_text(render: Callable[[], Iterable[str]]) -> str:
+    """Рендерит страницу в строку (режим --check)."""
+    return "\n".join(render())
+
+
+class OutputChecker(OutputWriter):
+    """Сравнивает сгенерированные файлы с файлами на диске, ничего не записывая (--check).
+
+    Отличия собираются в diffs как unified diff; файлы, которые при обычном
+    запуске были бы удалены, тоже считаются отличием.
+    """
+
+    def __init__(self, output_dir: Path, manifest_path: Path):
+        super().__init__(output_dir, manifest_path)
+        self.diffs: dict[str, list[str]] = {}
+
+    def compare(self, label: str, path: Path, content: str) -> None:
+        """Сравнивает content с файлом path и запоминает diff под именем label."""
+        try:
+            current = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            current = None
+        if current == content:
+            self.unchanged += 1
+            return
+
+        self.written += 1
+        self.diffs[label] = list(difflib.unified_diff(
+            [] if current is None else current.splitlines(),
+            content.splitlines(),
+            "/dev/null" if current is None else f"a/{label}",
+            f"b/{label}",
+            lineterm="",
+        ))
+
+    def emit_many(self, pages: list[tuple[str, Callable[[], Iterable[str]]]],
+                  executor: Optional[Executor] = None) -> None:
+        run = executor.map if executor is not None else map
+        for (rel_path, _), content in zip(pages, run(render_text, [render for _, render in pages])):
+            data = content.encode("utf-8")
+            digest = hashlib.sha256(data).hexdigest()
+            if self.current_digest(rel_path) == digest:
+                self.unchanged += 1
+            else:
+                self.compare(f"api/{rel_path}", self.output_dir / rel_path, content)
+            self.produced.add(rel_path)
+            self.page_stats[rel_path] = {"render": 0.0, "format_docstring": 0.0, "write": 0.0,
+                                         "format_calls": 0, "format_hits": 0}
+            self.manifest[rel_path] = {"sha256": digest, "size": len(data)}
+
+    def finalize(self) -> None:
+        """Учитывает устаревшие файлы; на диске ничего не меняется."""
+        if not self.output_dir.exists():
+            return
+        for path in sorted(self.output_dir.rglob("*")):
+            rel_path = path.relative_to(self.output_dir).as_posix()
+            if path.is_file() and rel_path not in self.produced:
+                self.removed += 1
+                self.diffs[f"api/{rel_path}"] = [f"--- a/api/{rel_path}", "+++ /dev/null"]
+
+    def report(self, max_lines: int = 40) -> None:
+        """Печатает сводку отличий: по каждому файлу число строк и начало diff."""
+        for label, diff in self.diffs.items():
+            added = sum(1 for line in diff if line.startswith("+") and not line.startswith("+++"))
+            removed = sum(1 for line in diff if line.startswith("-") and not line.startswith("---"))
+            status = "A" if diff[0] == "--- /dev/null" else "D" if diff[1] == "+++ /dev/null" else "M"
+            print(f"{status} {label} (+{added} -{removed})")
+            for line in diff[:max_lines]:
+                print(f"    {line}")
+            if len(diff) > max_lines:
+                print(f"    ... {len(diff) - max_lines} more lines")
+
+
+# Пороги веса страницы по умолчанию (--page-budget); bytes и gzip — в байтах
+PAGE_BUDGETS = {
+    "bytes": 200 * 1024,
+    "gzip": 32 * 1024,
+    "cards": 200,
+    "tables": 100,
+    "math": 200,
+    "details": 200,
+}
 
-    for submodule in submodules:
-        submodule_init = svetlanna_pkg / submodule / "__init__.py"
-        if submodule_init.exists():
-            module_info = parse_module(submodule_init)
-
-            # Also parse individual files in submodule
-            submodule_dir = svetlanna_pkg / submodule
-            for py_file in submodule_dir.glob("*.py"):
-                if py_file.name != "__init__.py":
-                    file_info = parse_module(py_file)
-                    module_info["classes"].extend(file_info["classes"])
-                    module_info["functions"].extend(file_info["functions"])
-
-            # Deduplicate classes by name
-            seen_classes = set()
-            unique_classes = []
-            for cls in module_info["classes"]:
-                if cls["name"] not in seen_classes:
-                    seen_classes.add(cls["name"])
-                    unique_classes.append(cls)
-            module_info["classes"] = unique_classes
-
-            # Skip empty modules
-            if not unique_classes and not module_info["functions"]:
-                print(f"Skipping empty module: {submodule}")
+# Страницы туториалов относительно app/, которые попадают в отчёт о весе
+TUTORIAL_PAGES = ["docs/tutorials/**/page.mdx", "docs/examples/**/page.mdx", "**/*.notebook/page.mdx"]
+
+CARD_PATTERN = re.compile(r'<div (?:id="[^"]*" )?className="border')
+TABLE_PATTERN = re.compile(r"^\|\s*:?-{3,}", re.MULTILINE)
+DISPLAY_MATH_PATTERN = re.compile(r"\$\$.*?\$\$", re.DOTALL)
+INLINE_MATH_PATTERN = re.compile(r"(?<![\\$])\$[^$\n]+?\$")
+
+
+def page_weight(data: bytes) -> dict[str, int]:
+    """Вес страницы: размер, размер после gzip и число тяжёлых элементов MDX.
+
+    cards — карточки свойств и методов, tables — таблицы, math — формулы
+    (блочные, строчные и заранее отрендеренные), details — раскрывающиеся блоки.
+    """
+    text = data.decode("utf-8")
+    display_math = DISPLAY_MATH_PATTERN.findall(text)
+    inline_text = DISPLAY_MATH_PATTERN.sub("", text)
+    return {
+        "bytes": len(data),
+        "gzip": len(gzip.compress(data, compresslevel=6, mtime=0)),
+        "cards": len(CARD_PATTERN.findall(text)),
+        "tables": len(TABLE_PATTERN.findall(text)),
+        "math": len(display_math) + len(INLINE_MATH_PATTERN.findall(inline_text)) + text.count(MATH_ATTRIBUTE),
+        "details": text.count("<details"),
+    }
+
+
+def page_weights(project_root: Path, writer: OutputWriter) -> dict[str, dict[str, int]]:
+    """Вес сгенерированных страниц API и страниц туториалов: {путь: метрики}."""
+    app_dir = project_root / "app"
+    paths = {writer.output_dir / rel_path for rel_path in writer.produced if rel_path.endswith(".mdx")}
+    for pattern in TUTORIAL_PAGES:
+        paths.update(app_dir.glob(pattern))
+    return {
+        path.relative_to(project_root).as_posix(): page_weight(path.read_bytes())
+        for path in sorted(paths)
+        if path.exists()
+    }
+
+
+def over_budget(weights: dict[str, dict[str, int]], budgets: dict[str, int]) -> list[str]:
+    """Сообщения о страницах, превышающих пороги."""
+    messages = []
+    for label, weight in weights.items():
+        for metric, limit in budgets.items():
+            if weight[metric] > limit:
+                messages.append(f"{label}: {metric} {weight[metric]} > {limit}")
+    return messages
+
+
+def parse_budget(text: str) -> tuple[str, int]:
+    """Разбирает METRIC=LIMIT для --page-budget; суффикс k означает KiB."""
+    metric, _, limit = text.partition("=")
+    if metric not in PAGE_BUDGETS:
+        raise argparse.ArgumentTypeError(f"unknown metric {metric!r}, expected one of {', '.join(PAGE_BUDGETS)}")
+    try:
+        value = int(limit[:-1]) * 1024 if limit.lower().endswith("k") else int(limit)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid limit {limit!r}") from None
+    return metric, value
+
+
+def write_page_report(path: Optional[Path], weights: dict[str, dict[str, int]], budgets: dict[str, int],
+                      fail: bool) -> None:
+    """Печатает сводку по весу страниц и превышения порогов, при fail завершает с ошибкой."""
+    if not weights:
+        return
+    heaviest = max(weights, key=lambda label: weights[label]["gzip"])
+    print(f"Page weight: {len(weights)} pages, {sum(w['bytes'] for w in weights.values()) / 1024:.1f} KiB; "
+          f"heaviest {heaviest} ({weights[heaviest]['bytes'] / 1024:.1f} KiB, "
+          f"gzip {weights[heaviest]['gzip'] / 1024:.1f} KiB)")
+
+    messages = over_budget(weights, budgets)
+    if path is not None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        report = {"budgets": budgets, "pages": weights, "over_budget": messages}
+        path.write_text(json.dumps(report, indent=1), encoding="utf-8")
+    for message in messages:
+        print(f"{'Error' if fail else 'Warning'}: page over budget: {message}")
+    if messages and fail:
+        sys.exit(1)
+
+
+def module_docstrings(module_info: ApiModule) -> Iterator[str]:
+    """Все непустые docstrings модуля: классы, их методы и функции."""
+    if module_info.docstring:
+        yield module_info.docstring
+    for class_info in module_info.classes:
+        if class_info.docstring:
+            yield class_info.docstring
+        yield from (m.docstring for m in class_info.methods if m.docstring)
+    yield from (f.docstring for f in module_info.functions if f.docstring)
+
+
+class Timings:
+    """Время стадий генерации и счётчики по модулям (--timings).
+
+    Стадии измеряются по настенным часам в основном процессе. Время render,
+    format_docstring и write суммируется по страницам, поэтому при -j N
+    оно может превышать время стадии emit, внутри которой выполняется.
+    Если включён tracemalloc, для стадий запоминается и пик памяти сверх
+    занятой к началу стадии (только основной процесс). format_cache —
+    вызовы format_docstring и попадания в FORMAT_CACHE по всем страницам.
+    """
+
+    # Стадии, суммируемые по страницам
+    PAGE_STAGES = ("render", "format_docstring", "write")
+
+    def __init__(self):
+        self.stages: dict[str, float] = {}
+        self.memory: dict[str, int] = {}
+        self.modules: dict[str, dict] = {}
+        self.format_cache = {"calls": 0, "hits": 0}
+
+    @contextmanager
+    def stage(self, name: str):
+        """Добавляет время выполнения блока к стадии name."""
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+            allocated = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - start
+            if tracing:
+                peak = tracemalloc.get_traced_memory()[1] - allocated
+                self.memory[name] = max(self.memory.get(name, 0), peak)
+
+    def add_module(self, name: str, files: list[Path], module_info: ApiModule, cache: ParseCache) -> None:
+        """Запоминает счётчики модуля после парсинга."""
+        self.modules[name] = {
+            "files": len(files),
+            "parse": sum(cache.parse_times.get(path, 0.0) for path in files),
+            "classes": len(module_info.classes),
+            "methods": sum(len(c.methods) for c in module_info.classes),
+            "functions": len(module_info.functions),
+            "docstring_bytes": sum(len(d.encode("utf-8")) for d in module_docstrings(module_info)),
+            "pages": 0,
+            "output_bytes": 0,
+            **{stage: 0.0 for stage in self.PAGE_STAGES},
+        }
+
+    def add_pages(self, writer: OutputWriter) -> None:
+        """Распределяет время и размер страниц по модулям."""
+        for rel_path, stats in writer.page_stats.items():
+            for stage in self.PAGE_STAGES:
+                self.stages[stage] = self.stages.get(stage, 0.0) + stats[stage]
+            self.format_cache["calls"] += stats["format_calls"]
+            self.format_cache["hits"] += stats["format_hits"]
+            # Самый длинный каталог страницы, совпадающий с модулем (возможно, в каталоге версии)
+            parts = rel_path.split("/")[:-1]
+            keys = [".".join(parts[:i]) for i in range(len(parts), 0, -1)]
+            keys += [f"{parts[0]}/" + ".".join(parts[1:i]) for i in range(len(parts), 1, -1)]
+            module = next((self.modules[key] for key in keys if key in self.modules), None)
+            if module is None:
                 continue
+            module["pages"] += 1
+            module["output_bytes"] += writer.manifest[rel_path]["size"]
+            for stage in self.PAGE_STAGES:
+                module[stage] += stats[stage]
+
+    def to_json(self) -> dict:
+        data = {"stages": self.stages, "modules": self.modules, "format_cache": self.format_cache}
+        if self.memory:
+            data["memory"] = self.memory
+        return data
+
+    def format_table(self) -> str:
+        """Таблица для вывода в консоль."""
+        lines = ["", f"{'stage':<20}{'time':>10}" + (f"{'peak':>12}" if self.memory else "")]
+        for name, seconds in self.stages.items():
+            line = f"{name:<20}{seconds * 1e3:>8.1f}ms"
+            if name in self.memory:
+                line += f"{self.memory[name] / 1024:>8.0f} KiB"
+            lines.append(line)
+        calls, hits = self.format_cache["calls"], self.format_cache["hits"]
+        if calls:
+            lines.append(f"\nformat_docstring cache: {hits} of {calls} calls hit ({hits / calls:.0%})")
+
+        columns = ["files", "classes", "methods", "functions", "docstring_bytes", "output_bytes",
+                   "parse", *self.PAGE_STAGES]
+        header = f"{'module':<32}" + "".join(f"{c.replace('_bytes', ' KiB'):>{len(c) + 2}}" for c in columns)
+        lines += ["", header, "-" * len(header)]
+        for name, module in self.modules.items():
+            row = f"{name:<32}"
+            for column in columns:
+                width = len(column) + 2
+                value = module[column]
+                if column.endswith("_bytes"):
+                    row += f"{value / 1024:>{width}.1f}"
+                elif isinstance(value, float):
+                    row += f"{value * 1e3:>{width - 2}.1f}ms"
+                else:
+                    row += f"{value:>{width}}"
+            lines.append(row)
+        return "\n".join(lines)
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    """Разбирает аргументы командной строки."""
+    parser = argparse.ArgumentParser(description="Генератор API документации для SVETlANNa")
+    parser.add_argument(
+        "--repo-url",
+        default=REPO_URL,
+        help="URL репозитория SVETlANNa (по умолчанию GitHub)",
+    )
+    parser.add_argument(
+        "--ref",
+        default="HEAD",
+        help="ветка или тег, для которых генерируется документация",
+    )
+    parser.add_argument(
+        "--source",
+        type=Path,
+        metavar="PATH",
+        help="локальный клон SVETlANNa (или каталог пакета svetlanna) вместо загрузки из git",
+    )
+    parser.add_argument(
+        "--project-root",
+        type=Path,
+        metavar="PATH",
+        help="каталог, в который пишутся app/docs/api, public/api-symbols.json и .temp "
+             "(по умолчанию корень репозитория документации)",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="с --source: следить за изменениями файлов и обновлять затронутые страницы",
+    )
+    parser.add_argument(
+        "--watch-interval",
+        type=float,
+        default=0.25,
+        metavar="SECONDS",
+        help="период опроса файлов в режиме --watch (по умолчанию 0.25 с)",
+    )
+    parser.add_argument(
+        "--versions",
+        nargs="+",
+        default=[],
+        metavar="REF",
+        help="дополнительные версии (теги, ветки): документация в app/docs/api/<версия>/, "
+             "файлы читаются из git без checkout",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="генерировать документацию, даже если upstream не изменился",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="ничего не записывать, сравнить сгенерированные страницы с текущими; "
+             "код выхода 1, если они отличаются, 2 — при ошибке",
+    )
+    parser.add_argument(
+        "--include",
+        action="append",
+        default=[],
+        metavar="PATTERN",
+        help="документировать только подпакеты, подходящие под шаблон fnmatch "
+             "(например, \"elements.*\"); можно указать несколько раз",
+    )
+    parser.add_argument(
+        "--exclude",
+        action="append",
+        default=list(DEFAULT_EXCLUDE),
+        metavar="PATTERN",
+        help="не документировать подпакеты, подходящие под шаблон, и вложенные в них; "
+             f"добавляется к {' '.join(DEFAULT_EXCLUDE)}",
+    )
+    parser.add_argument(
+        "--prerender-math",
+        action="store_true",
+        help="рендерить формулы в HTML через katex (нужны node и pnpm install) "
+             "вместо рендера при сборке сайта",
+    )
+    parser.add_argument(
+        "--split-pages",
+        action="store_true",
+        help="отдельная страница для каждого класса и группы функций",
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=1,
+        help="число процессов для парсинга и рендеринга (по умолчанию 1 — последовательно)",
+    )
+    parser.add_argument(
+        "--page-report",
+        type=Path,
+        metavar="PATH",
+        help="записать вес каждой страницы API и туториалов в JSON",
+    )
+    parser.add_argument(
+        "--page-budget",
+        type=parse_budget,
+        action="append",
+        default=[],
+        metavar="METRIC=LIMIT",
+        help=f"порог веса страницы ({', '.join(f'{k}={v}' for k, v in PAGE_BUDGETS.items())}); "
+             "для bytes и gzip можно указать KiB: gzip=40k",
+    )
+    parser.add_argument(
+        "--fail-on-budget",
+        action="store_true",
+        help="завершиться с ошибкой, если страница превышает порог (по умолчанию — предупреждение)",
+    )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="вывести время стадий и счётчики по модулям",
+    )
+    parser.add_argument(
+        "--timings-json",
+        type=Path,
+        metavar="PATH",
+        help="сохранить время стадий и счётчики в JSON",
+    )
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        metavar="PATH",
+        help="сохранить профиль cProfile основного процесса (для snakeviz, pstats)",
+    )
+    args = parser.parse_args(argv)
+    if args.watch and args.source is None:
+        parser.error("--watch requires --source")
+    if args.source is not None and args.versions:
+        parser.error("--versions cannot be combined with --source")
+    if args.check and args.watch:
+        parser.error("--check cannot be combined with --watch")
+    return args
 
-            # Generate MDX
-            submodule_output = output_dir / submodule
-            submodule_output.mkdir(exist_ok=True)
 
-            mdx_content = generate_module_mdx(submodule, module_info, submodule=True)
-            (submodule_output / "page.mdx").write_text(mdx_content, encoding="utf-8")
-            print(f"Generated: api/{submodule}/page.mdx")
+def main(argv: Optional[list[str]] = None):
+    args = parse_args(argv)
+    timings = Timings()
 
-            meta_entries[submodule] = submodule.replace("_", " ").title()
-            generated_submodules.append((submodule, module_info))
+    try:
+        if args.profile:
+            profiler = cProfile.Profile()
+            profiler.runcall(generate, args, timings)
+            profiler.dump_stats(args.profile)
+            print(f"Profile saved to {args.profile}")
+        else:
+            generate(args, timings)
+    except SystemExit as error:
+        # With --check only CHECK_OUTDATED means "out of date", any other failure is CHECK_ERROR
+        if not args.check or error.code in (None, 0, CHECK_OUTDATED):
+            raise
+        if not isinstance(error.code, int):
+            print(error.code, file=sys.stderr)
+        sys.exit(CHECK_ERROR)
+    except Exception:
+        if not args.check:
+            raise
+        traceback.print_exc()
+        sys.exit(CHECK_ERROR)
+
+    if args.timings:
+        print(timings.format_table())
+    if args.timings_json:
+        args.timings_json.write_text(json.dumps(timings.to_json(), indent=2) + "\n", encoding="utf-8")
+        print(f"Timings saved to {args.timings_json}")
+
+
+def source_package(source: Path) -> Path:
+    """Каталог пакета svetlanna в локальном клоне (или сам source)."""
+    if (source / "svetlanna" / "__init__.py").exists():
+        return (source / "svetlanna").resolve()
+    if (source / "__init__.py").exists():
+        return source.resolve()
+    sys.exit(f"Package svetlanna not found in {source}")
+
+
+def module_dependencies(resolver: ExportResolver, file_groups: dict[str, list[Path]],
+                        modules: list[ApiModule]) -> dict[str, set[Path]]:
+    """Файлы, от которых зависят страницы каждого модуля."""
+    dependencies = {}
+    for module in modules:
+        files = set(file_groups[module.name])
+        for path in file_groups[module.name]:
+            files |= resolver.file_dependencies(path)
+        dependencies[module.name] = files
+    return dependencies
+
+
+def links_key(modules: list[ApiModule], split_pages: bool) -> str:
+    """Хэш таблицы символов и унаследованных членов всех классов.
+
+    Ссылки на типы и списки унаследованных членов ведут в другие модули,
+    поэтому при изменении этого хэша страницы всех модулей устаревают.
+    """
+    symbols = SymbolTable(modules, split_pages)
+    hierarchy = ClassHierarchy(modules, symbols)
+    inherited = {
+        f"{module_info.package}.{class_info.name}": [
+            [entry.base, entry.url, entry.members] for entry in hierarchy.inherited(module_info, class_info)
+        ]
+        for module_info in modules for class_info in module_info.classes
+    }
+    return hashlib.sha1(json.dumps([symbols.key, inherited]).encode("utf-8")).hexdigest()
+
+
+def write_pages(writer: OutputWriter, modules: list[ApiModule], split_pages: bool,
+                timings: Timings, version_modules: list = (), executor: Optional[Executor] = None,
+                affected: Optional[set[str]] = None, math: Optional[MathRenderer] = None) -> None:
+    """Записывает страницы модулей, обзоры и _meta.js, удаляет устаревшие файлы.
+
+    affected — модули, страницы которых нужно перерендерить (None — все);
+    страницы остальных модулей остаются на диске без изменений. С math
+    формулы вставляются в страницы готовым HTML.
+    """
+    pages = []
+    meta_files = {}
+    for version, version_modules_list in [(None, modules), *version_modules]:
+        # One symbol table and class hierarchy per version: links point into the same version
+        symbols = SymbolTable(version_modules_list, split_pages, version)
+        hierarchy = ClassHierarchy(version_modules_list, symbols)
+        for module_info in version_modules_list:
+            context = RenderContext(symbols)
+            if affected is None or module_info.name in affected:
+                context.inherited = {
+                    class_info.name: hierarchy.inherited(module_info, class_info)
+                    for class_info in module_info.classes
+                }
+            if math is not None and (affected is None or module_info.name in affected):
+                # Only the module's own formulas travel with its pages to the workers
+                with timings.stage("math"):
+                    context.math = math.render_modules([module_info])
+            module_page_list, module_meta = module_pages(module_info, split_pages, version, context)
+            if affected is None or module_info.name in affected:
+                pages.extend(module_page_list)
+            else:
+                writer.keep(rel_path for rel_path, _ in module_page_list)
+            # Nested subpackages go before the class pages in the sidebar
+            module_meta = {**module_titles(version_modules_list, module_info.name), **module_meta}
+            if module_meta:
+                module_dir = f"{version}/{module_info.path}" if version else module_info.path
+                meta_files[f"{module_dir}/_meta.js"] = generate_meta_js(module_meta)
+    with timings.stage("emit"):
+        writer.emit_many(pages, executor)
+
+    with timings.stage("overview/meta"):
+        # Generate main API overview page
+        versions = [slug for slug, _ in version_modules]
+        overview_content = generate_api_overview(modules, versions=versions)
+        writer.write("page.mdx", overview_content)
+        for slug, version_modules_list in version_modules:
+            writer.write(f"{slug}/page.mdx", generate_api_overview(version_modules_list, slug))
+            writer.write(f"{slug}/_meta.js", generate_meta_js(module_titles(version_modules_list)))
+
+        # Write _meta.js (without "index" - page.mdx serves as index in App Router)
+        for rel_path, meta_content in meta_files.items():
+            writer.write(rel_path, meta_content)
+        writer.write("_meta.js", generate_meta_js({**module_titles(modules), **{slug: slug for slug in versions}}))
+        writer.finalize()
+    timings.add_pages(writer)
+
+
+def write_symbol_index(path: Path, modules: list[ApiModule], split_pages: bool,
+                       checker: Optional[OutputChecker] = None) -> None:
+    """Записывает индекс символов для перехода к определениям на клиенте.
+
+    С checker файл не записывается, а сравнивается с текущим (режим --check).
+    """
+    symbol_index = build_symbol_index(modules, split_pages)
+    content = json.dumps(symbol_index, ensure_ascii=False, separators=(",", ":"))
+    if checker is not None:
+        checker.compare("public/api-symbols.json", path, content)
+    elif update_file(path, content):
+        print(f"Generated: public/api-symbols.json ({len(symbol_index['symbols'])} symbols)")
+
+
+def package_snapshot(svetlanna_pkg: Path) -> dict[Path, tuple[int, int]]:
+    """Время изменения и размер всех .py файлов пакета.
+
+    Исключённые подпакеты тоже отслеживаются: из них могут импортироваться
+    документируемые объекты.
+    """
+    snapshot = {}
+    for path in walk_package(svetlanna_pkg):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+
+def watch(args: argparse.Namespace, svetlanna_pkg: Path, parsed: dict[Path, dict],
+          cache: ParseCache, writer: OutputWriter, symbols_path: Path,
+          math: Optional[MathRenderer] = None) -> None:
+    """Опрашивает файлы пакета и обновляет страницы модулей, зависящих от изменённых.
+
+    Результаты парсинга хранятся в памяти, при изменении перепарсиваются
+    только изменённые файлы. Если изменились таблица символов или
+    унаследованные члены классов, обновляются страницы всех модулей.
+    """
+    snapshot = package_snapshot(svetlanna_pkg)
+    resolver = ExportResolver(svetlanna_pkg, parsed, cache.parse)
+    file_groups = root_module_groups(resolver, package_file_groups(svetlanna_pkg, snapshot, args.include, args.exclude),
+                                     args.include, args.exclude)
+    modules = collect_modules(resolver, file_groups, cache, Timings())
+    dependencies = module_dependencies(resolver, file_groups, modules)
+    links = links_key(modules, args.split_pages)
+    print(f"\nWatching {svetlanna_pkg} for changes (Ctrl+C to stop)...")
 
-    # Generate main API overview page
-    overview_content = generate_api_overview(generated_submodules)
-    (output_dir / "page.mdx").write_text(overview_content, encoding="utf-8")
-    print(f"Generated: api/page.mdx")
+    try:
+        while True:
+            time.sleep(args.watch_interval)
+            current = package_snapshot(svetlanna_pkg)
+            changed = {path for path in snapshot.keys() | current.keys() if snapshot.get(path) != current.get(path)}
+            if not changed:
+                continue
+            snapshot = current
+            start = time.perf_counter()
+
+            for path in changed:
+                parsed.pop(path, None)
+                if path in current:
+                    parsed[path] = cache.parse(path)
+
+            resolver = ExportResolver(svetlanna_pkg, parsed, cache.parse)
+            file_groups = root_module_groups(
+                resolver, package_file_groups(svetlanna_pkg, current, args.include, args.exclude),
+                args.include, args.exclude,
+            )
+            modules = collect_modules(resolver, file_groups, cache, Timings())
+            new_dependencies = module_dependencies(resolver, file_groups, modules)
+            # Старые зависимости тоже учитываются: файл мог перестать влиять на модуль
+            affected = {
+                module.name for module in modules
+                if changed & (new_dependencies[module.name] | dependencies.get(module.name, set()))
+            }
+            dependencies = new_dependencies
+            # Type links and inherited members are not file dependencies: re-render everything
+            new_links = links_key(modules, args.split_pages)
+            if new_links != links:
+                affected = {module.name for module in modules}
+            links = new_links
+
+            writer.reset()
+            write_pages(writer, modules, args.split_pages, Timings(), affected=affected, math=math)
+            write_symbol_index(symbols_path, modules, args.split_pages)
+            elapsed = (time.perf_counter() - start) * 1e3
+            names = ", ".join(sorted(path.relative_to(svetlanna_pkg).as_posix() for path in changed))
+            print(f"{names}: {len(affected)} modules re-rendered, {writer.written} pages written in {elapsed:.0f} ms")
+    except KeyboardInterrupt:
+        print()
+    finally:
+        cache.save()
+        if math is not None:
+            math.save()
+            math.close()
+
+
+def generate(args: argparse.Namespace, timings: Timings) -> None:
+    """Генерирует документацию, записывая время стадий в timings."""
+    # Paths
+    script_dir = Path(__file__).parent
+    project_root = args.project_root or script_dir.parent
+    temp_dir = project_root / ".temp"
+    svetlanna_dir = temp_dir / "SVETlANNa"
+    output_dir = project_root / "app" / "docs" / "api"
+    symbols_path = project_root / "public" / "api-symbols.json"
+    model_path = temp_dir / "api-model.json"
+    state_path = temp_dir / "cache" / "state.json"
+    temp_dir.mkdir(parents=True, exist_ok=True)
+
+    if args.source is not None:
+        # Local checkout: no git, the output no longer matches any upstream commit
+        svetlanna_pkg = source_package(args.source)
+        state = None
+        versions = []
+    else:
+        # Skip everything if neither upstream nor the generator changed since the last run
+        with timings.stage("resolve"):
+            state = {
+                "commit": resolve_remote_ref(args.repo_url, args.ref),
+                "generator": hashlib.sha256(Path(__file__).read_bytes()).hexdigest(),
+                "versions": {ref: resolve_remote_ref(args.repo_url, ref) for ref in args.versions},
+                # Options that change the pages: a run with other options must not be skipped
+                "options": {
+                    "split_pages": args.split_pages,
+                    "include": sorted(set(args.include)),
+                    "exclude": sorted(set(args.exclude)),
+                    "prerender_math": args.prerender_math,
+                },
+            }
+        # --check always compares: pages could have been edited by hand
+        if not args.force and not args.check and output_dir.exists() and load_state(state_path) == state:
+            print(f"Upstream is still at {state['commit'][:12]}, nothing to regenerate")
+            return
+
+        versions = [(version_slug(ref), ref) for ref in args.versions]
+        if any(not slug for slug, _ in versions):
+            sys.exit(f"Cannot derive a directory name from versions {args.versions}")
+
+        # Clone/update SVETlANNa
+        with timings.stage("clone/update"):
+            clone_or_update_repo(args.repo_url, svetlanna_dir, state["commit"])
+            for ref, commit in state["versions"].items():
+                fetch_commit(svetlanna_dir, commit)
+        svetlanna_pkg = svetlanna_dir / "svetlanna"
 
-    # Write _meta.js
-    meta_content = "export default {\n"
-    for key, value in meta_entries.items():
-        meta_content += f'  "{key}": "{value}",\n'
-    meta_content += "};\n"
-    (output_dir / "_meta.js").write_text(meta_content, encoding="utf-8")
-    print(f"Generated: api/_meta.js")
+    # Parse main module
+    cache = ParseCache(temp_dir / "cache" / "parse-cache.json")
+    writer_class = OutputChecker if args.check else OutputWriter
+    writer = writer_class(output_dir, temp_dir / "cache" / "output-manifest.json")
+    executor = ProcessPoolExecutor(max_workers=args.jobs) if args.jobs > 1 else None
+
+    # Discover subpackages, then parse all files at once so that cache misses can be processed in parallel
+    with timings.stage("discover"):
+        file_groups = package_file_groups(svetlanna_pkg, walk_package(svetlanna_pkg, args.exclude),
+                                          args.include, args.exclude)
+    all_files = [path for group in file_groups.values() for path in group]
+    with timings.stage("parse"):
+        parsed = dict(zip(all_files, cache.parse_many(all_files, executor)))
+
+    # Public names are resolved statically from __init__.py imports and __all__
+    resolver = ExportResolver(svetlanna_pkg, parsed, cache.parse)
+    file_groups = root_module_groups(resolver, file_groups, args.include, args.exclude)
+    modules = collect_modules(resolver, file_groups, cache, timings)
+    for slug, ref in versions:
+        if slug in module_titles(modules):
+            sys.exit(f"Version {ref!r} conflicts with a module page name")
+
+    # Versions are read straight from git objects, without checking them out
+    version_modules = []
+    if versions:
+        store = GitObjectStore(svetlanna_dir)
+        version_pkg = PurePosixPath("svetlanna")
+        for slug, ref in versions:
+            commit = state["versions"][ref]
+            with timings.stage("parse"):
+                tree = store.list_files(commit)
+                prefetch_blobs(svetlanna_dir, commit, tree.values())
+                version_groups = package_file_groups(version_pkg, tree, args.include, args.exclude)
+                version_files = {path: tree[path] for group in version_groups.values() for path in group}
+                version_parsed = dict(zip(version_files, cache.parse_blobs(version_files, store.read_blob, executor)))
+
+            version_resolver = ExportResolver(
+                version_pkg, version_parsed,
+                lambda path, tree=tree: cache.parse_blobs({path: tree[path]}, store.read_blob)[0],
+                files=set(tree),
+            )
+            version_groups = root_module_groups(version_resolver, version_groups, args.include, args.exclude)
+            version_modules.append((slug, collect_modules(version_resolver, version_groups, cache, timings, f"{slug}/")))
+        store.close()
+
+    # Formulas are rendered by katex once, in a single node process
+    math = MathRenderer(script_dir.parent, temp_dir / "cache" / "math-cache.json") if args.prerender_math else None
+
+    # Generate MDX
+    write_pages(writer, modules, args.split_pages, timings, version_modules, executor, math=math)
+    if executor is not None:
+        executor.shutdown()
+    if math is not None and not args.watch:
+        math.close()
+
+    # Symbol index for client-side jump to definitions
+    with timings.stage("symbol index"):
+        write_symbol_index(symbols_path, modules, args.split_pages, writer if args.check else None)
+
+    if math is not None:
+        math.save()
+        print(f"Math cache: {math.hits} hits, {math.misses} misses")
+
+    if args.check:
+        cache.save()
+        print(f"Parse cache: {cache.hits} hits, {cache.misses} misses")
+        if writer.diffs:
+            writer.report()
+            print(f"\nAPI documentation is out of date: {writer.written} changed, "
+                  f"{writer.removed} stale, {writer.unchanged} up to date")
+            sys.exit(CHECK_OUTDATED)
+        print(f"API documentation is up to date ({writer.unchanged} files)")
+        return
+
+    # Parsed API model for other tools (ApiModule.from_info restores it)
+    with timings.stage("api model"):
+        save_api_model(model_path, modules, version_modules, state["commit"] if state else None)
+
+    with timings.stage("save cache"):
+        cache.save()
+        if state is not None:
+            save_state(state_path, state)
+        else:
+            state_path.unlink(missing_ok=True)
+    print(f"Parse cache: {cache.hits} hits, {cache.misses} misses")
+    print(f"Output: {writer.written} written, {writer.unchanged} unchanged, {writer.removed} removed")
+
+    with timings.stage("page weight"):
+        weights = page_weights(project_root, writer)
+    write_page_report(args.page_report, weights, {**PAGE_BUDGETS, **dict(args.page_budget)}, args.fail_on_budget)
 
     print("\nAPI documentation generated successfully!")
 
+    if args.watch:
+        watch(args, svetlanna_pkg, parsed, cache, writer, symbols_path, math)
+
 
 if __name__ == "__main__":
     main()